@@ -0,0 +1,89 @@
+import argparse
+import os
+import random
+import statistics
+import time
+import pygame
+
+parser = argparse.ArgumentParser(description="compare the frame times of the render backends on a stress scene of bouncing enemies")
+parser.add_argument("--frames", type=int, default=600, help="frames measured after the warmup")
+parser.add_argument("--warmup", type=int, default=60, help="frames drawn before measuring, while textures get uploaded")
+parser.add_argument("--enemies", type=int, default=150, help="enemies kept alive in the scene")
+parser.add_argument("--software", action="store_true", help="force SDL's software renderer for the SDL2 backend")
+parser.add_argument("--window", action="store_true", help="open real windows instead of using SDL's dummy video driver")
+parser.add_argument("--static-wallpaper", action="store_true", help="keep the wallpaper still instead of scrolling its bands")
+options = parser.parse_args()
+
+if not options.window:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+from game import *
+import config
+
+# Both backends draw the same draw lists, the surface one needs the full size display and RGB sprites
+config.RENDER_BACKEND = RENDER_BACKEND_SURFACE
+config.USE_PALETTE_RENDERING = False
+
+pygame.init()
+Window.init()
+GameClock.init()
+GameClock.mode = CLOCK_FIXED
+TextureRenderer.init("benchmark", (WINDOW_WIDTH, WINDOW_HEIGHT), (WINDOW_WIDTH // Window.scale, WINDOW_HEIGHT // Window.scale), options.software)
+
+from scene import *
+
+if options.static_wallpaper:
+    GameManager.background.speeds = [0]
+
+GameManager.set_theme(NOKIA_DARK, CITY_WALLPAPER)
+
+random.seed(0)
+player.lives = 999
+enemy_classes = [Comet, Shuttle, VShip, Rocket, Acorn, Snake, Drone, Virus, Cockroach, Bean, Centipede]
+
+times : dict[str, list[float]] = {"surface (dirty rects)": [], "surface (full frames)": [], "sdl2 textures": []}
+
+for frame in range(options.warmup + options.frames):
+    pygame.event.pump()
+    Input.keys = pygame.key.get_pressed()
+    GameClock.tick()
+
+    while len(game_context.find_with_tag(TAG_ENEMY)) < options.enemies:
+        random.choice(enemy_classes)(
+            context = game_context,
+            x = random.randint(MAP_LEFT_BOUND, MAP_RIGHT_BOUND),
+            y = random.randint(MAP_TOP_BOUND, MAP_BOTTOM_BOUND - SPRITE_SMALL_HEIGHT),
+            horizontal_speed = random.randint(1, 3),
+            vertical_speed = random.randint(1, 3),
+            vertical_direction = random.choice([UP, DOWN]),
+            horizontal_stop_distance = -WINDOW_WIDTH
+        )
+
+    game_context.simulate()
+    game_ui_context.simulate()
+
+    GameManager.render()
+    game_context.render()
+    game_ui_context.render()
+    draw_list = RenderQueue.collect()
+
+    # The wallpaper bands scroll in the first draw of each draw list, the full frame draw finds them already in place.
+    # The full frame draw leaves the dirty rect state as the dirty draw does, so each keeps diffing against the last frame
+    for name, draw in [
+        ("surface (dirty rects)", lambda: Window.present(RenderQueue.draw(draw_list, Window.screen))),
+        ("surface (full frames)", lambda: Window.present(RenderQueue.draw((draw_list[0], draw_list[1], True, draw_list[3]), Window.screen))),
+        ("sdl2 textures", lambda: TextureRenderer.draw(draw_list))
+    ]:
+        start = time.perf_counter()
+        draw()
+
+        if frame >= options.warmup:
+            times[name].append((time.perf_counter() - start) * 1000)
+
+print(f"{options.frames} frames, {options.enemies} enemies, {len(draw_list[0])} draw list entries in the last frame, renderer {'software' if options.software else 'default'}, {'static' if options.static_wallpaper else 'scrolling'} wallpaper")
+
+for name, samples in times.items():
+    samples.sort()
+    print(f"{name}: mean {statistics.mean(samples):.3f} ms, median {statistics.median(samples):.3f} ms, p95 {samples[int(len(samples) * 0.95)]:.3f} ms")
+
+pygame.quit()
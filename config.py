@@ -1,4 +1,5 @@
 from core import Sprite, TextureAtlas, Font, Text
+import os
 
 # CONFIGURATION FILE FOR Py-Space-Impact
 # Edit anything you like
@@ -8,6 +9,38 @@ WINDOW_WIDTH = 1140
 WINDOW_HEIGHT = 720
 WINDOW_TITLE = "スーペース・インパクト"
 
+# Everything is drawn into a framebuffer RENDER_SCALE times smaller than the window, which is upscaled once when presented.
+# Textures are kept at 1/RENDER_SCALE of their on screen size, 4 keeps them at their native size, larger values lose detail.
+# Must divide both WINDOW_WIDTH and WINDOW_HEIGHT, 1 draws straight into the window
+RENDER_SCALE = 1
+
+# Draw into an 8bit palette indexed framebuffer with 8bit sprites, a theme switch then only changes the ink color of the palette
+USE_PALETTE_RENDERING = False
+
+# Draw and present each frame on a render thread while the next one is simulated, with at most RENDER_THREAD_QUEUE_SIZE frames waiting
+USE_RENDER_THREAD = False
+RENDER_THREAD_QUEUE_SIZE = 2
+
+# RENDER_BACKEND_SURFACE blits into surfaces, RENDER_BACKEND_SDL2 uploads every surface once to a pygame._sdl2 Texture and redraws the frame with the Renderer.
+# The SDL2 backend works with neither USE_PALETTE_RENDERING nor USE_RENDER_THREAD, SDL2_SOFTWARE_RENDERER forces SDL's software renderer
+RENDER_BACKEND_SURFACE = "surface"
+RENDER_BACKEND_SDL2 = "sdl2"
+RENDER_BACKEND = RENDER_BACKEND_SURFACE
+SDL2_SOFTWARE_RENDERER = False
+
+# Bytes of decoded and tinted sprite pixels kept loaded, past it the least recently drawn sprites are unloaded until drawn again
+ASSET_BUDGET = 24 * 1024 * 1024
+
+# Bake the scaled and trimmed sprite pixels into ASSET_CACHE_DIR on the first run and map them from there afterwards
+USE_ASSET_CACHE = True
+ASSET_CACHE_DIR = ".cache/sprites"
+
+# Threads decoding the textures preloaded together, 1 decodes them one after another on the main thread
+ASSET_LOAD_THREADS = min(4, os.cpu_count() or 1)
+
+# While the scene is static (game over) or the window is unfocused the loop blocks on events and runs at most IDLE_FPS frames per second
+IDLE_FPS = 5
+
 MAP_VERTICAL_BOUND_OFFSET = 100
 MAP_HORIZONTAL_BOUND_OFFSET = 0
 MAP_TOP_BOUND = WINDOW_HEIGHT - (WINDOW_HEIGHT - MAP_VERTICAL_BOUND_OFFSET)
@@ -357,6 +390,9 @@ BATTLE_SHIP_SHIELD_ANIMATIONS = [Sprite.load("textures/battleship_shield1.png",
 BATTLE_SHIP_SHIELD_ANIMATIONS_INTERVAL = 100
 BATTLE_SHIP_SHIELD_DURATION = 5000
 
+# Wallpapers scroll left in bands for parallax, the lowest band at the first speed in pixels per second, the one above it at the second and so on
+WALLPAPER_SPEEDS = [60, 30]
+
 VOID_WALLPAPER = Sprite.load("textures/wallpapers/void.png", WINDOW_WIDTH, WINDOW_HEIGHT)
 SKY_WALLPAPER = Sprite.load("textures/wallpapers/sky.png", WINDOW_WIDTH, WINDOW_HEIGHT)
 MOUNTAINS_WALLPAPER = Sprite.load("textures/wallpapers/mountains.png", WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -390,21 +426,56 @@ BOUNCY_DEFAULT_HORIZONTAL_STOP_DISTANCE = 2147483648
 BOUNCY_DEFAULT_VERTICAL_STOP_SPEED = 4
 ENEMY_SHOOT_ROLL_INTERVAL = 1000
 BOSS_ENEMY_DAMAGE_BLINK_DURATION = 75
+# The size of the cells of the grid every Context uses to index its GameObjects for rect queries
+SPATIAL_HASH_CELL_SIZE = 12 * 12
+
+# Render layers, drawn from the lowest to the highest
+LAYER_WALLPAPER = 0
+LAYER_ENEMIES = 1
+LAYER_PROJECTILES = 2
+LAYER_PLAYER = 3
+LAYER_SHIELD = 4
+LAYER_HUD = 5
 
 UP = "up"
 LEFT = "left"
 RIGHT = "right"
 DOWN = "down"
 
+TAG_PLAYER = "player"
 TAG_ENEMY = "enemy"
 TAG_PROJECTILE_PLAYER = "projectile_player"
 TAG_PROJECTILE_ENEMY = "projectile_enemy"
+TAG_PICKUP = "pickup"
+
+# Which tags interact. Once per frame, every object tagged with a key gets `on_collision(other)` called for each overlapping object tagged with one of its values
+COLLISION_MATRIX = {
+    TAG_PROJECTILE_PLAYER: [TAG_ENEMY, TAG_PROJECTILE_ENEMY],
+    TAG_PROJECTILE_ENEMY: [TAG_PLAYER],
+    TAG_ENEMY: [TAG_PLAYER],
+    TAG_PICKUP: [TAG_PLAYER]
+}
+
+# (margin, lifetime) of each tag. Objects whose rect ends up more than margin pixels outside the window, or alive for more than lifetime ms, are destroyed.
+# A lifetime of -1 never expires. Tags missing from the table, like the player flying away, are never despawned.
+# The enemies margin covers the boss abilities that retreat beyond the right edge
+DESPAWN_POLICY = {
+    TAG_ENEMY: (1200, -1),
+    TAG_PROJECTILE_PLAYER: (200, 10000),
+    TAG_PROJECTILE_ENEMY: (200, 10000),
+    TAG_PICKUP: (200, 30000)
+}
 
 NOKIA_LIGHT = "nokia_light"
 NOKIA_DARK = "nokia_dark"
 NOKIA_LIGHT_COLOR = (128, 183, 146)
 NOKIA_DARK_COLOR = (0, 0, 0)
 
+# Every themed sprite keeps one tinted variant per theme, THEME_TINTS[i] being the objects tint of THEMES[i].
+# The first theme is the one in use before any level sets its own
+THEMES = [NOKIA_DARK, NOKIA_LIGHT]
+THEME_TINTS = [NOKIA_LIGHT_COLOR, NOKIA_DARK_COLOR]
+
 FONT_RECT_COLOR = (186, 85, 211)
 
 FONT_SPACE_IMPACT_COUNTERS_TEXTURE_ATLAS_CHAR_WIDTH = 8 * 3
@@ -549,6 +620,15 @@ GAME_OVER_SCORE_TEXT_FONT_SIZE = 10
 GAME_OVER_SCORE_VALUE_TEXT = "ABC123:-gtyyx"
 GAME_OVER_SCORE_VALUE_TEXT_FONT_SIZE = 10
 
+# How the game clock advances every frame. CLOCK_REALTIME follows the wall clock, CLOCK_FIXED advances CLOCK_FIXED_STEP milliseconds per frame
+# (fast-forwards when the frame rate is uncapped) and CLOCK_SCALED advances the wall clock time multiplied by CLOCK_SCALE
+CLOCK_REALTIME = "realtime"
+CLOCK_FIXED = "fixed"
+CLOCK_SCALED = "scaled"
+CLOCK_MODE = CLOCK_REALTIME
+CLOCK_FIXED_STEP = 1000 / 60
+CLOCK_SCALE = 1.0
+
 # Use 16bit numbers for counters such as score, health and rockets. If False, uses 32bit integers
 USE_16BIT_INTEGERS = True
 # Freezes the score on overflow.
@@ -1,42 +1,642 @@
+import concurrent.futures
+import hashlib
+import mmap
+import os
 import pygame
+import queue
+import struct
+import sys
+import threading
+import time
+from typing import Callable
 
 class Window:
+    # Surface everything is rendered into, the display itself or the logical framebuffer when RENDER_SCALE isn't 1
     screen : pygame.Surface = None
+    display : pygame.Surface = None
+    scale : int = 1
+    # With USE_PALETTE_RENDERING the screen and every sprite share `palette`, blits between them copy indices.
+    # The screen is presented through `palette_view`, a view of the same pixels whose INK entry is the current theme tint
+    palette : list[tuple[int, int, int]] = None
+    palette_view : pygame.Surface = None
+    INK = 2
+    # When headless nothing is rendered nor presented, the display only exists so that surfaces can still be converted
+    headless : bool = False
 
     @staticmethod
-    def init():
-        from config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE
+    def init(headless : bool = False):
+        from config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, RENDER_SCALE, USE_PALETTE_RENDERING, NOKIA_LIGHT_COLOR, THEME_TINTS
+        from config import RENDER_BACKEND, RENDER_BACKEND_SDL2, SDL2_SOFTWARE_RENDERER, USE_RENDER_THREAD
+
+        if WINDOW_WIDTH % RENDER_SCALE != 0 or WINDOW_HEIGHT % RENDER_SCALE != 0:
+            raise ValueError(f"RENDER_SCALE {RENDER_SCALE} doesn't divide the {WINDOW_WIDTH}x{WINDOW_HEIGHT} window")
+
+        Window.headless = headless
+        Window.scale = RENDER_SCALE
+        size = (WINDOW_WIDTH // RENDER_SCALE, WINDOW_HEIGHT // RENDER_SCALE)
+
+        if RENDER_BACKEND == RENDER_BACKEND_SDL2 and not headless:
+            if USE_PALETTE_RENDERING or USE_RENDER_THREAD:
+                raise ValueError("RENDER_BACKEND_SDL2 works with neither USE_PALETTE_RENDERING nor USE_RENDER_THREAD")
 
-        Window.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            # A renderer can't share its window with the display surface, the hidden display only lets surfaces be converted
+            Window.display = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            Window.screen = Window.display
+            TextureRenderer.init(WINDOW_TITLE, (WINDOW_WIDTH, WINDOW_HEIGHT), size, SDL2_SOFTWARE_RENDERER)
+            return
+
+        Window.display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption(WINDOW_TITLE)
 
+        if USE_PALETTE_RENDERING:
+            # Unused entries are black so that black always maps to the transparent index 0
+            Window.palette = [(0, 0, 0), NOKIA_LIGHT_COLOR, (255, 255, 255)] + [(0, 0, 0)] * 253
+            Window.screen = pygame.Surface(size, depth=8)
+            Window.screen.set_palette(Window.palette)
+            Window.palette_view = Window.screen.subsurface(Window.screen.get_rect())
+            Window.set_ink(THEME_TINTS[0])
+        elif RENDER_SCALE == 1:
+            Window.screen = Window.display
+        else:
+            Window.screen = pygame.Surface(size).convert()
+
+    @staticmethod
+    def set_ink(color : tuple[int, int, int]):
+        """
+        Sets the color the INK index is presented with, a no-op unless USE_PALETTE_RENDERING.
+        """
+        if Window.palette_view != None:
+            Window.palette_view.set_palette_at(Window.INK, color)
+
+    @staticmethod
+    def draw(draw_list : tuple):
+        """
+        Draws and presents a draw list of `RenderQueue.collect()` with the configured backend.
+        """
+        if TextureRenderer.renderer != None:
+            TextureRenderer.draw(draw_list)
+        else:
+            Window.present(RenderQueue.draw(draw_list, Window.screen))
+
+    @staticmethod
+    def present(dirty : list[pygame.Rect]):
+        """
+        Pushes the dirty rects of `Window.screen` to the display, upscaling them first when drawing at a logical resolution
+        and converting them through `palette_view` when drawing with a palette.
+        """
+        if Window.screen is Window.display:
+            pygame.display.update(dirty)
+            return
+
+        scale = Window.scale
+        source = Window.screen if Window.palette_view == None else Window.palette_view
+        bounds = source.get_rect()
+        updated : list[pygame.Rect] = []
+
+        for rect in dirty:
+            rect = rect.clip(bounds)
+
+            if rect.width == 0 or rect.height == 0:
+                continue
+
+            target = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+
+            if scale == 1:
+                Window.display.blit(source, target, rect)
+            elif Window.palette_view != None:
+                Window.display.blit(pygame.transform.scale(source.subsurface(rect), target.size), target)
+            else:
+                pygame.transform.scale(source.subsurface(rect), target.size, Window.display.subsurface(target))
+
+            updated.append(target)
+
+        pygame.display.update(updated)
+
+class GameClock:
+    """
+    Simulation time read by every timer of the game through `get_ticks()`. `main.py` advances it once per frame with `GameClock.tick()`.\n
+    `CLOCK_REALTIME` follows the wall clock, `CLOCK_FIXED` advances `step` ms per frame whatever the frame rate
+    and `CLOCK_SCALED` advances the wall clock time multiplied by `scale`. While `paused` the time doesn't advance.
+    """
+    mode : str = None
+    step : float = 1000 / 60
+    scale : float = 1.0
+    paused : bool = False
+
+    time : float = 0.0
+    ticks : int = 0
+    last_real_ticks : int = 0
+
+    @staticmethod
+    def init():
+        from config import CLOCK_MODE, CLOCK_FIXED_STEP, CLOCK_SCALE
+
+        GameClock.mode = CLOCK_MODE
+        GameClock.step = CLOCK_FIXED_STEP
+        GameClock.scale = CLOCK_SCALE
+        GameClock.last_real_ticks = pygame.time.get_ticks()
+
+    @staticmethod
+    def tick():
+        from config import CLOCK_FIXED, CLOCK_SCALED
+
+        real_ticks = pygame.time.get_ticks()
+        real_delta = real_ticks - GameClock.last_real_ticks
+        GameClock.last_real_ticks = real_ticks
+
+        if GameClock.paused:
+            return
+
+        if GameClock.mode == CLOCK_FIXED:
+            GameClock.advance(GameClock.step)
+        elif GameClock.mode == CLOCK_SCALED:
+            GameClock.advance(real_delta * GameClock.scale)
+        else:
+            GameClock.advance(real_delta)
+
+    @staticmethod
+    def advance(milliseconds : float):
+        GameClock.time += milliseconds
+        GameClock.ticks = int(GameClock.time)
+
+def get_ticks() -> int:
+    return GameClock.ticks
+
 class Sprite:
+    # Index of the variant drawn by every sprite that has tint variants, switching theme only changes this index
+    variant : int = 0
+    # Pixels trimmed by `Sprite.decode` from each resource, as (pixels before, pixels after, bytes per pixel)
+    trimmed : dict[str, tuple[int, int, int]] = {}
+
     def __init__(
             self,
-            surface : pygame.Surface
+            surface : pygame.Surface,
+            offset : tuple[int, int] = (0, 0)
         ):
-            self.surface = surface
+            self.tinted = surface
             self.surface_untouched = surface
             self.tint_color : tuple[int, int, int] = (-1, -1, -1)
+            self.variants : list[pygame.Surface] = None
+            self.variant_colors : list[tuple[int, int, int]] = None
+            # Where the surface is drawn from the owner's rect, in window pixels
+            self.trim_offset = offset
+
+            # Sprites of `Sprite.load` have no pixels until `Assets` loads them on first use, it may unload them again
+            self.resource : str = None
+            self.size : tuple[int, int] = None
+            self.last_used = 0
+
+    @property
+    def surface(self) -> pygame.Surface:
+        if self.tinted == None:
+            Assets.load(self)
+
+        Assets.uses += 1
+        self.last_used = Assets.uses
+
+        if self.variants == None:
+            return self.tinted
+
+        return self.variants[Sprite.variant]
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        if self.tinted == None:
+            Assets.load(self)
+
+        return self.trim_offset
     
     def tint(self, color : tuple[int, int, int]):
         if self.tint_color == color:
             return
         
-        self.surface = self.surface_untouched.copy().convert_alpha()
-        self.surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        if self.surface_untouched != None:
+            self.tinted = TintCache.get(self.surface_untouched, color)
+
+        self.tint_color = color
+
+    def prepare_variants(self, colors : list[tuple[int, int, int]]):
+        """
+        Tints one variant per color, the one drawn is then picked by `Sprite.variant`.\n
+        With USE_PALETTE_RENDERING every variant is the same surface drawn with the INK index, whose color follows the theme.\n
+        Variants of a sprite that isn't loaded are tinted once it is.
+        """
+        self.variant_colors = colors
+
+        if self.surface_untouched == None:
+            return
+
+        if Window.palette != None:
+            self.variants = [TintCache.get(self.surface_untouched, Window.palette[Window.INK])] * len(colors)
+        else:
+            self.variants = [TintCache.get(self.surface_untouched, color) for color in colors]
 
     @staticmethod
-    def load(resource : str, width : int, height : int):
-        surface = pygame.image.load(resource)
-        surface = pygame.transform.scale(surface, (width, height))
-        return Sprite(surface)
+    def load(resource : str, width : int, height : int) -> 'Sprite':
+        """
+        Registers `resource` to be loaded and scaled on first use, see `Assets`.
+        """
+        sprite = Sprite(None)
+        sprite.resource = resource
+        sprite.size = (width, height)
+        Assets.sprites.append(sprite)
+
+        return sprite
+
+    @staticmethod
+    def decode(resource : str, width : int, height : int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Loads and scales `resource`, then crops it to its non transparent bounding box, the returned offset keeps it in place.\n
+        With USE_ASSET_CACHE the result is baked into `AssetCache` and later mapped from it instead of decoded.
+        """
+        from config import RENDER_SCALE, USE_ASSET_CACHE
+
+        size = Sprite.logical_size(width, height)
+        path = AssetCache.path(resource, size) if USE_ASSET_CACHE else None
+        baked = AssetCache.read(path) if path != None else None
+
+        if baked != None:
+            surface, position, before, bytesize = baked
+        else:
+            surface = pygame.image.load(resource)
+            surface = pygame.transform.scale(surface, size)
+            bounds = surface.get_bounding_rect()
+            position = bounds.topleft
+            before = surface.get_width() * surface.get_height()
+            bytesize = surface.get_bytesize()
+
+            if bounds.size != surface.get_size():
+                surface = surface.subsurface(bounds).copy()
+
+            if path != None:
+                AssetCache.write(path, surface, position, before, bytesize)
+
+        Sprite.trimmed[resource] = (before, surface.get_width() * surface.get_height(), bytesize)
+
+        return surface, (position[0] * RENDER_SCALE, position[1] * RENDER_SCALE)
 
     @staticmethod
     def from_surface(surface : pygame.Surface, width : int, height : int) -> 'Sprite':
-        surface = pygame.transform.scale(surface, (width, height))
+        surface = pygame.transform.scale(surface, Sprite.logical_size(width, height))
         return Sprite(surface)
 
+    @staticmethod
+    def trim_report() -> str:
+        lines = []
+        total_pixels = 0
+        total_bytes = 0
+
+        for resource, (before, after, bytesize) in Sprite.trimmed.items():
+            lines.append(f"{resource}: {before} -> {after} pixels, {before - after} pixels and {(before - after) * bytesize} bytes saved")
+            total_pixels += before - after
+            total_bytes += (before - after) * bytesize
+
+        lines.append(f"Total: {total_pixels} pixels and {total_bytes} bytes saved over {len(Sprite.trimmed)} textures")
+        return "\n".join(lines)
+
+    @staticmethod
+    def logical_size(width : int, height : int) -> tuple[int, int]:
+        """
+        Size in the logical framebuffer of a texture `width`x`height` pixels large on screen.
+        """
+        from config import RENDER_SCALE
+        return (max(1, round(width / RENDER_SCALE)), max(1, round(height / RENDER_SCALE)))
+
+class AssetCache:
+    """
+    Scaled and trimmed sprite pixels baked to ASSET_CACHE_DIR, one file per source and size, so later runs map them instead of decoding.\n
+    A file is named after the resource path, the logical size and the hash of the source file, editing a texture or its size constant
+    misses the old one, writing the new one deletes the other files of the same resource and size.
+    Files hold a header and the raw RGB or RGBA rows, surfaces are made with `pygame.image.frombuffer` over a copy on write mapping.
+    """
+    # Magic, width, height, trimmed x and y, pixels before trimming, bytes per pixel before baking, has colorkey, colorkey RGB
+    HEADER = struct.Struct("<4s2H2hIB?3B")
+    MAGIC = b"SIB1"
+
+    hits : int = 0
+    misses : int = 0
+    failures : int = 0
+
+    @staticmethod
+    def path(resource : str, size : tuple[int, int]) -> str:
+        from config import ASSET_CACHE_DIR
+
+        with open(resource, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+
+        name = hashlib.sha1(os.path.normpath(resource).encode()).hexdigest()[:16]
+
+        return os.path.join(ASSET_CACHE_DIR, f"{name}-{size[0]}x{size[1]}-{digest}.bin")
+
+    @staticmethod
+    def read(path : str) -> tuple[pygame.Surface, tuple[int, int], int, int]:
+        """
+        Returns the baked surface, its trimmed position and the `Sprite.trimmed` stats, or None if it isn't baked (or is corrupt).
+        """
+        try:
+            with open(path, "rb") as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            AssetCache.misses += 1
+            return None
+
+        header = AssetCache.HEADER
+
+        if len(data) < header.size:
+            AssetCache.misses += 1
+            return None
+
+        magic, width, height, x, y, before, bytesize, keyed, *colorkey = header.unpack_from(data)
+        pixels = len(data) - header.size
+
+        if magic != AssetCache.MAGIC or pixels not in (width * height * 3, width * height * 4):
+            AssetCache.misses += 1
+            return None
+
+        surface = pygame.image.frombuffer(memoryview(data)[header.size:], (width, height), "RGB" if pixels == width * height * 3 else "RGBA")
+
+        if keyed:
+            surface.set_colorkey(colorkey)
+
+        AssetCache.hits += 1
+        return surface, (x, y), before, bytesize
+
+    @staticmethod
+    def write(path : str, surface : pygame.Surface, position : tuple[int, int], before : int, bytesize : int):
+        """
+        Bakes `surface`, per pixel alpha surfaces as RGBA and the others as RGB with their colorkey.\n
+        The file is written aside and renamed, so a reader never maps a partial one, then the stale files of the same resource and size are deleted.
+        Failing to write only counts in `failures`.
+        """
+        colorkey = surface.get_colorkey()
+        alpha = surface.get_flags() & pygame.SRCALPHA
+        header = AssetCache.HEADER.pack(
+            AssetCache.MAGIC, surface.get_width(), surface.get_height(), position[0], position[1], before, bytesize,
+            colorkey != None and not alpha, *(colorkey[:3] if colorkey != None else (0, 0, 0))
+        )
+
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        # The cache is only a speed up, a location that can't be written just leaves the sprite unbaked
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with open(temporary, "wb") as file:
+                file.write(header)
+                file.write(pygame.image.tobytes(surface, "RGBA" if alpha else "RGB"))
+
+            os.replace(temporary, path)
+
+            directory, name = os.path.split(path)
+            prefix = name.rsplit("-", 1)[0] + "-"
+
+            for other in os.listdir(directory):
+                if other != name and other.startswith(prefix) and other.endswith(".bin"):
+                    try:
+                        os.remove(os.path.join(directory, other))
+                    except OSError:
+                        pass
+        except OSError:
+            AssetCache.failures += 1
+
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+    @staticmethod
+    def stats() -> dict[str, int]:
+        return {"hits": AssetCache.hits, "misses": AssetCache.misses, "failures": AssetCache.failures}
+
+class Assets:
+    """
+    Registry of the sprites of `Sprite.load`, which load their pixels on first use instead of when `config` is imported.\n
+    Past ASSET_BUDGET bytes of loaded pixels, tinted copies included, the least recently drawn sprites are unloaded,
+    they load again the next time they are drawn. `Assets.preload(sprites)` loads them ahead, e.g. before a level starts.\n
+    Every decode is timed in `timings`, `Assets.load_report()` sums them up against the wall time spent preloading.
+    """
+    sprites : list[Sprite] = []
+    loaded : list[Sprite] = []
+    # Counts the accesses to `Sprite.surface`, a sprite's `last_used` is the count of its latest one
+    uses : int = 0
+    loads : int = 0
+    unloads : int = 0
+
+    # Milliseconds of the latest decode of each resource, and of the wall time of every preload
+    timings : dict[str, float] = {}
+    preload_time : float = 0.0
+
+    @staticmethod
+    def load(sprite : Sprite):
+        Assets.attach(sprite, *Assets.decode(sprite))
+
+    @staticmethod
+    def decode(sprite : Sprite) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Decodes the pixels of `sprite` without touching it, safe to call from any thread.
+        """
+        start_time = time.perf_counter()
+        decoded = Sprite.decode(sprite.resource, *sprite.size)
+        Assets.timings[sprite.resource] = (time.perf_counter() - start_time) * 1000
+
+        return decoded
+
+    @staticmethod
+    def attach(sprite : Sprite, surface : pygame.Surface, offset : tuple[int, int]):
+        """
+        Gives `sprite` its decoded pixels, then tints them and keeps the budget. Tinting converts to the display format, so it runs on the main thread.
+        """
+        sprite.surface_untouched, sprite.trim_offset = surface, offset
+        sprite.tinted = sprite.surface_untouched
+
+        if sprite.tint_color != (-1, -1, -1):
+            sprite.tinted = TintCache.get(sprite.surface_untouched, sprite.tint_color)
+
+        if sprite.variant_colors != None:
+            sprite.prepare_variants(sprite.variant_colors)
+
+        Assets.uses += 1
+        sprite.last_used = Assets.uses
+        Assets.loaded.append(sprite)
+        Assets.loads += 1
+        Assets.trim()
+
+    @staticmethod
+    def preload(sprites : list[Sprite]):
+        """
+        Loads the sprites that aren't loaded, decoding them on ASSET_LOAD_THREADS threads since pygame's image loaders,
+        scaling and hashing release the GIL. Returns once every one of them is attached.
+        """
+        from config import ASSET_LOAD_THREADS
+
+        start_time = time.perf_counter()
+        pending = list(dict.fromkeys(sprite for sprite in sprites if sprite.tinted == None))
+
+        if ASSET_LOAD_THREADS > 1 and len(pending) > 1:
+            with concurrent.futures.ThreadPoolExecutor(ASSET_LOAD_THREADS) as executor:
+                decoded = list(executor.map(Assets.decode, pending))
+        else:
+            decoded = [Assets.decode(sprite) for sprite in pending]
+
+        for sprite, (surface, offset) in zip(pending, decoded):
+            Assets.attach(sprite, surface, offset)
+
+        Assets.preload_time += (time.perf_counter() - start_time) * 1000
+
+    @staticmethod
+    def load_report() -> str:
+        from config import ASSET_LOAD_THREADS
+
+        lines = [f"{resource}: {milliseconds:.2f} ms" for resource, milliseconds in sorted(Assets.timings.items(), key=lambda item: -item[1])]
+        lines.append(f"Total: {sum(Assets.timings.values()):.2f} ms decoding {len(Assets.timings)} textures, {Assets.preload_time:.2f} ms wall time preloading on {ASSET_LOAD_THREADS} threads")
+        return "\n".join(lines)
+
+    @staticmethod
+    def unload(sprite : Sprite):
+        source = sprite.surface_untouched
+        surfaces = TintCache.forget(source) + [source]
+
+        for surface in surfaces:
+            split = ScrollingWallpaper.splits.pop(surface, None)
+
+            if split != None:
+                TextureRenderer.forget([split[0]] + split[1])
+
+        TextureRenderer.forget(surfaces)
+
+        sprite.surface_untouched = None
+        sprite.tinted = None
+        sprite.variants = None
+
+        Assets.loaded.remove(sprite)
+        Assets.unloads += 1
+
+    @staticmethod
+    def trim():
+        """
+        Unloads the least recently used sprites until the loaded ones fit in ASSET_BUDGET, the latest one always stays.
+        """
+        from config import ASSET_BUDGET
+
+        used = Assets.used()
+
+        if used <= ASSET_BUDGET:
+            return
+
+        for sprite in sorted(Assets.loaded, key=lambda sprite: sprite.last_used)[:-1]:
+            used -= Assets.size_of(sprite)
+            Assets.unload(sprite)
+
+            if used <= ASSET_BUDGET:
+                break
+
+    @staticmethod
+    def size_of(sprite : Sprite) -> int:
+        surfaces = {sprite.surface_untouched, sprite.tinted}
+
+        if sprite.variants != None:
+            surfaces.update(sprite.variants)
+
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface in surfaces)
+
+    @staticmethod
+    def used() -> int:
+        return sum(Assets.size_of(sprite) for sprite in Assets.loaded)
+
+    @staticmethod
+    def stats() -> dict[str, int]:
+        return {"registered": len(Assets.sprites), "loaded": len(Assets.loaded), "bytes": Assets.used(), "loads": Assets.loads, "unloads": Assets.unloads}
+
+class TintCache:
+    """
+    Tinted copies of source surfaces keyed by `(surface, color)`, shared by every sprite using the same source.\n
+    Only a miss copies pixels, tinting an already tinted source again is a dictionary lookup.\n
+    With USE_PALETTE_RENDERING tinted copies are 8bit surfaces of `Window.palette`, pixels less than half opaque become the transparent index 0.\n
+    Otherwise copies whose alpha is only ever fully transparent or fully opaque become RLE accelerated colorkey surfaces, the others keep per pixel alpha.
+    """
+    # Candidate colorkeys, the first one no opaque pixel uses is picked
+    COLORKEYS = [(255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3)]
+
+    surfaces : dict[tuple[pygame.Surface, tuple[int, int, int]], pygame.Surface] = {}
+    hits : int = 0
+    misses : int = 0
+
+    @staticmethod
+    def get(surface : pygame.Surface, color : tuple[int, int, int]) -> pygame.Surface:
+        key = (surface, color)
+        tinted = TintCache.surfaces.get(key, None)
+
+        if tinted != None:
+            TintCache.hits += 1
+            return tinted
+
+        TintCache.misses += 1
+        tinted = surface.copy().convert_alpha()
+        tinted.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+
+        if Window.palette != None:
+            opaque = tinted.convert()
+            pygame.mask.from_surface(tinted, 127).to_surface(opaque, setsurface=opaque.copy(), unsetcolor=(0, 0, 0))
+            tinted = pygame.Surface(tinted.get_size(), depth=8)
+            tinted.set_palette(Window.palette)
+            tinted.blit(opaque, (0, 0))
+            tinted.set_colorkey(0, pygame.RLEACCEL)
+        else:
+            tinted = TintCache.accelerate(tinted)
+
+        TintCache.surfaces[key] = tinted
+
+        return tinted
+
+    @staticmethod
+    def accelerate(surface : pygame.Surface) -> pygame.Surface:
+        """
+        Converts a per pixel alpha surface with binary alpha to an opaque or RLE colorkey surface of the display format.\n
+        Surfaces with partially transparent pixels are returned as they are.
+        """
+        pixels = pygame.image.tobytes(surface, "RGBA")
+        alpha = pixels[3::4]
+
+        if len(alpha.translate(None, b"\x00\xff")) != 0:
+            return surface
+
+        if alpha.find(b"\x00") == -1:
+            return surface.convert()
+
+        for colorkey in TintCache.COLORKEYS:
+            if not TintCache.__uses(pixels, bytes(colorkey) + b"\xff"):
+                keyed = pygame.Surface(surface.get_size()).convert()
+                keyed.fill(colorkey)
+                keyed.blit(surface, (0, 0))
+                keyed.set_colorkey(colorkey, pygame.RLEACCEL)
+                return keyed
+
+        return surface
+
+    @staticmethod
+    def forget(surface : pygame.Surface) -> list[pygame.Surface]:
+        """
+        Drops the tinted copies of `surface` and returns them.
+        """
+        keys = [key for key in TintCache.surfaces if key[0] is surface]
+        return [TintCache.surfaces.pop(key) for key in keys]
+
+    @staticmethod
+    def __uses(pixels : bytes, pixel : bytes) -> bool:
+        index = pixels.find(pixel)
+
+        while index != -1:
+            if index % 4 == 0:
+                return True
+
+            index = pixels.find(pixel, index + 1)
+
+        return False
+
+    @staticmethod
+    def stats() -> dict[str, int]:
+        return {"hits": TintCache.hits, "misses": TintCache.misses, "surfaces": len(TintCache.surfaces)}
+
 class TextureAtlas:
     def __init__(
         self,
@@ -45,7 +645,9 @@ class TextureAtlas:
         textures_height : int,
         textures_gap : int
     ):
-        self.surface = pygame.image.load(resource)
+        # Loaded by the first `get_sprite()`
+        self.resource = resource
+        self.surface : pygame.Surface = None
 
         self.textures_width = textures_width
         self.textures_height = textures_height
@@ -55,6 +657,9 @@ class TextureAtlas:
         width = self.textures_width if width == -1 else width
         height = self.textures_height if height == -1 else height
 
+        if self.surface == None:
+            self.surface = pygame.image.load(self.resource)
+
         x = x * self.textures_width + x * self.textures_gap
         y = y * self.textures_height + y * self.textures_gap
         rect = pygame.Rect(x, y, width, height)
@@ -62,27 +667,694 @@ class TextureAtlas:
 
         return Sprite(subsurface)
 
+class RenderQueue:
+    """
+    Collects the `(surface, position)` pairs submitted while rendering a frame into explicit layers.\n
+    `RenderQueue.collect()` turns them into an immutable draw list, `RenderQueue.draw(draw_list, target)` redraws only the regions
+    whose entries changed since the last draw, lowest layer first, and returns them for `pygame.display.update`.\n
+    The whole frame is redrawn after `RenderQueue.invalidate()` or when the background layer changes.
+    """
+    layers : dict[int, list[tuple[pygame.Surface, tuple[int, int]]]] = {}
+    solids : dict[tuple[int, int, tuple[int, int, int]], pygame.Surface] = {}
+    updates : list[tuple[Callable, tuple]] = []
+
+    # Past this many dirty rects a whole frame redraw is cheaper than redrawing each of them
+    MAX_DIRTY_RECTS = 32
+
+    previous : set[tuple[pygame.Surface, tuple[int, int]]] = set()
+    previous_background : list[tuple[pygame.Surface, tuple[int, int]]] = []
+    full_redraw : bool = True
+
+    @staticmethod
+    def submit(layer : int, surface : pygame.Surface, position : tuple[int, int]):
+        """
+        `position` is in window coordinates, it's mapped to the logical framebuffer when RENDER_SCALE isn't 1.
+        """
+        if Window.scale != 1:
+            position = (position[0] // Window.scale, position[1] // Window.scale)
+
+        entries = RenderQueue.layers.get(layer, None)
+
+        if entries == None:
+            RenderQueue.layers[layer] = [(surface, position)]
+        else:
+            entries.append((surface, position))
+
+    @staticmethod
+    def submit_rect(layer : int, color : tuple[int, int, int], rect : pygame.Rect):
+        """
+        Queues a filled rect as a blit of a cached solid surface, so that it keeps its place in the layer.
+        """
+        scale = Window.scale
+        width = (rect.width + scale - 1) // scale
+        height = (rect.height + scale - 1) // scale
+
+        key = (width, height, color)
+        surface = RenderQueue.solids.get(key, None)
+
+        if surface == None:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            RenderQueue.solids[key] = surface
+
+        RenderQueue.submit(layer, surface, rect.topleft)
+
+    @staticmethod
+    def submit_update(update : Callable, *arguments):
+        """
+        Queues `update(*arguments)` to run when the draw list is drawn, it returns the rects (logical pixels) it changed.
+        """
+        RenderQueue.updates.append((update, arguments))
+
+    @staticmethod
+    def invalidate():
+        RenderQueue.full_redraw = True
+
+    @staticmethod
+    def collect() -> tuple[tuple[tuple[pygame.Surface, tuple[int, int]], ...], int, bool, tuple[tuple[Callable, tuple], ...]]:
+        """
+        Empties the layers into a draw list: every entry in drawing order, how many of them are the background, whether the whole frame must be redrawn
+        and the queued updates.
+        """
+        from config import LAYER_WALLPAPER
+
+        entries : list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        for layer in sorted(RenderQueue.layers.keys()):
+            entries.extend(RenderQueue.layers[layer])
+
+        draw_list = (tuple(entries), len(RenderQueue.layers.get(LAYER_WALLPAPER, [])), RenderQueue.full_redraw, tuple(RenderQueue.updates))
+        RenderQueue.full_redraw = False
+        RenderQueue.updates.clear()
+
+        for layer_entries in RenderQueue.layers.values():
+            layer_entries.clear()
+
+        return draw_list
+
+    @staticmethod
+    def draw(draw_list : tuple[tuple[tuple[pygame.Surface, tuple[int, int]], ...], int, bool, tuple[tuple[Callable, tuple], ...]], target : pygame.Surface) -> list[pygame.Rect]:
+        entries, background_count, full_redraw, updates = draw_list
+        background = entries[:background_count]
+        current = set(entries[background_count:])
+
+        changed = [pygame.Rect(position, surface.get_size()) for surface, position in current.symmetric_difference(RenderQueue.previous)]
+        dirty = None
+
+        for update, arguments in updates:
+            changed.extend(update(*arguments))
+
+        # A changed entry adds at most one rect before merging, so past twice the limit the merge can be skipped
+        if not full_redraw and background == RenderQueue.previous_background and len(changed) <= RenderQueue.MAX_DIRTY_RECTS * 2:
+            dirty = RenderQueue.__merge(changed)
+
+            if len(dirty) > RenderQueue.MAX_DIRTY_RECTS:
+                dirty = None
+
+        if dirty == None:
+            target.fill((0, 0, 0))
+            target.blits(entries, doreturn=False)
+            dirty = [target.get_rect()]
+        elif len(dirty) != 0:
+            rects = [pygame.Rect(position, surface.get_size()) for surface, position in entries]
+
+            for rect in dirty:
+                target.set_clip(rect)
+                target.fill((0, 0, 0), rect)
+                target.blits([entries[i] for i in rect.collidelistall(rects)], doreturn=False)
+
+            target.set_clip(None)
+
+        RenderQueue.previous = current
+        RenderQueue.previous_background = background
+
+        return dirty
+
+    @staticmethod
+    def __merge(rects : list[pygame.Rect]) -> list[pygame.Rect]:
+        """
+        Unions overlapping rects while the union costs no more area than drawing both of them, so that a moving sprite's old and new rects become one region without snowballing across the field.
+        """
+        merged : list[pygame.Rect] = []
+
+        for rect in rects:
+            merging = True
+
+            while merging:
+                merging = False
+
+                for index in rect.collidelistall(merged):
+                    other = merged[index]
+                    union = rect.union(other)
+
+                    if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                        merged.pop(index)
+                        rect = union
+                        merging = True
+                        break
+
+            merged.append(rect)
+
+        return merged
+
+class ScrollingWallpaper:
+    """
+    A wallpaper split into horizontal bands, each scrolling left at its own speed and wrapping around for parallax.\n
+    The bands are the runs of rows between single colored rows, so no drawing is cut in two. The lowest band scrolls at the first
+    of `speeds` (window pixels per second), the one above it at the second and so on. Single colored rows never scroll.
+    Every source is split once, `splits` keeps its opaque copy, band tiles and band tops.\n
+    The surface backend keeps one framebuffer sized buffer as the background entry. A `RenderQueue.submit_update()` scrolls each
+    moved band in place with `Surface.scroll` and blits the strip it exposed from the band's tile, then redraws only that band.\n
+    The SDL2 backend keeps its textures unchanged and submits each band tile twice at its wrapped position instead.
+    """
+    splits : dict[pygame.Surface, tuple[pygame.Surface, list[pygame.Surface], list[int]]] = {}
+
+    def __init__(self, speeds : list[int]):
+        self.speeds = speeds
+        self.source : pygame.Surface = None
+        self.opaque : pygame.Surface = None
+        self.tiles : list[pygame.Surface] = []
+        self.tops : list[int] = []
+        self.tile_speeds : list[int] = []
+        self.buffer : pygame.Surface = None
+
+        # Only touched by the updates, which run wherever the draw lists are drawn
+        self.drawn_buffer : pygame.Surface = None
+        self.buffer_source : pygame.Surface = None
+        self.buffer_offsets : list[int] = []
+
+    def set_source(self, source : pygame.Surface):
+        """
+        Switches to the band tiles of `source`, a framebuffer sized surface, splitting it the first time.
+        """
+        if source is self.source:
+            return
+
+        # The old textures would stay in TextureRenderer.textures for as long as the game runs
+        TextureRenderer.forget([self.source, self.opaque] + self.tiles)
+
+        split = ScrollingWallpaper.splits.get(source, None)
+
+        if split == None:
+            split = ScrollingWallpaper.split(source)
+            ScrollingWallpaper.splits[source] = split
+
+        self.source = source
+        self.opaque, self.tiles, self.tops = split
+        self.tile_speeds = [self.speeds[min(index, len(self.speeds) - 1)] for index in range(len(self.tiles))]
+
+        # The buffer is reused across sources unless their format differs, a palette one must keep the source's palette
+        if self.buffer == None or self.buffer.get_size() != source.get_size() or self.buffer.get_bitsize() != source.get_bitsize() \
+            or (source.get_bitsize() == 8 and self.buffer.get_palette() != source.get_palette()):
+            self.buffer = self.opaque.copy()
+            self.buffer.set_colorkey(source.get_colorkey())
+
+    @staticmethod
+    def split(source : pygame.Surface) -> tuple[pygame.Surface, list[pygame.Surface], list[int]]:
+        width, height = source.get_size()
+
+        # Strips are copied over stale pixels, so the tiles and buffer must not skip colorkey pixels
+        opaque = source
+
+        if source.get_colorkey() != None:
+            opaque = source.copy()
+            opaque.set_colorkey(None)
+
+        pixels = pygame.image.tobytes(opaque, "RGB")
+        stride = width * 3
+        bands : list[tuple[int, int]] = []
+
+        for y in range(height):
+            row = pixels[y * stride:(y + 1) * stride]
+
+            if row != row[:3] * width:
+                if len(bands) != 0 and bands[-1][1] == y:
+                    bands[-1] = (bands[-1][0], y + 1)
+                else:
+                    bands.append((y, y + 1))
+
+        bands.reverse()
+
+        return (opaque, [opaque.subsurface((0, top, width, bottom - top)) for top, bottom in bands], [top for top, _ in bands])
+
+    def update(self, time : int):
+        """
+        Moves every band to where it is `time` milliseconds after the start and submits the wallpaper to LAYER_WALLPAPER.
+        """
+        from config import LAYER_WALLPAPER, RENDER_BACKEND, RENDER_BACKEND_SDL2
+
+        if self.source == None:
+            return
+
+        scale = Window.scale
+        width = self.opaque.get_width()
+        offsets = [int(speed * time) // 1000 // scale % width for speed in self.tile_speeds]
+
+        if RENDER_BACKEND == RENDER_BACKEND_SDL2:
+            RenderQueue.submit(LAYER_WALLPAPER, self.opaque, (0, 0))
+
+            for tile, top, offset in zip(self.tiles, self.tops, offsets):
+                RenderQueue.submit(LAYER_WALLPAPER, tile, (-offset * scale, top * scale))
+                RenderQueue.submit(LAYER_WALLPAPER, tile, ((width - offset) * scale, top * scale))
+
+            return
+
+        RenderQueue.submit_update(self.scroll_to, self.buffer, self.opaque, self.tiles, self.tops, offsets)
+        RenderQueue.submit(LAYER_WALLPAPER, self.buffer, (0, 0))
+
+    def scroll_to(self, buffer : pygame.Surface, opaque : pygame.Surface, tiles : list[pygame.Surface], tops : list[int], offsets : list[int]) -> list[pygame.Rect]:
+        """
+        Brings `buffer` to the bands of `opaque` at `offsets` and returns the rows it changed.
+        """
+        damaged : list[pygame.Rect] = []
+
+        if buffer is not self.drawn_buffer or opaque is not self.buffer_source:
+            buffer.blit(opaque, (0, 0))
+            self.drawn_buffer = buffer
+            self.buffer_source = opaque
+            self.buffer_offsets = [0] * len(tiles)
+            damaged.append(buffer.get_rect())
+
+        width = buffer.get_width()
+
+        for index, (tile, top, offset) in enumerate(zip(tiles, tops, offsets)):
+            if self.buffer_offsets[index] != offset:
+                ScrollingWallpaper.__scroll(buffer.subsurface((0, top, width, tile.get_height())), tile, self.buffer_offsets[index], offset)
+                self.buffer_offsets[index] = offset
+                damaged.append(pygame.Rect(0, top, width, tile.get_height()))
+
+        return damaged
+
+    @staticmethod
+    def __scroll(view : pygame.Surface, tile : pygame.Surface, old : int, new : int):
+        width, height = view.get_size()
+        distance = (new - old) % width
+
+        view.scroll(-distance, 0)
+
+        # The exposed columns show the tile from the old offset on, wrapping around its right edge
+        first = min(distance, width - old)
+        view.blit(tile, (width - distance, 0), (old, 0, first, height))
+
+        if first < distance:
+            view.blit(tile, (width - distance + first, 0), (0, 0, distance - first, height))
+
+class RenderThread:
+    """
+    Draws and presents the draw lists of `RenderQueue.collect()` on its own thread, while the main thread simulates the next frame.\n
+    At most `size` draw lists wait in the queue, `producer_wait` and `consumer_wait` sum the seconds the main thread spent blocked
+    on a full queue and the render thread spent idle on an empty one.\n
+    An exception on the render thread stops it, `submit()` and `stop()` then raise it on the main thread instead of waiting forever.
+    """
+    thread : threading.Thread = None
+    draw_lists : queue.Queue = None
+    error : BaseException = None
+
+    frames : int = 0
+    producer_wait : float = 0.0
+    consumer_wait : float = 0.0
+
+    @staticmethod
+    def start(size : int):
+        RenderThread.draw_lists = queue.Queue(size)
+        RenderThread.thread = threading.Thread(target=RenderThread.run, name="render", daemon=True)
+        RenderThread.thread.start()
+
+    @staticmethod
+    def submit(draw_list : tuple):
+        start = time.perf_counter()
+        RenderThread.put(draw_list)
+        RenderThread.producer_wait += time.perf_counter() - start
+
+    @staticmethod
+    def put(draw_list : tuple):
+        """
+        Queues `draw_list`, waking up now and then to raise the render thread's exception if it died while the queue was full.
+        """
+        while True:
+            if not RenderThread.thread.is_alive():
+                raise RenderThread.error if RenderThread.error != None else RuntimeError("the render thread has stopped")
+
+            try:
+                RenderThread.draw_lists.put(draw_list, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    @staticmethod
+    def run():
+        while True:
+            start = time.perf_counter()
+            draw_list = RenderThread.draw_lists.get()
+            RenderThread.consumer_wait += time.perf_counter() - start
+
+            if draw_list == None:
+                return
+
+            try:
+                Window.draw(draw_list)
+            except BaseException as error:
+                RenderThread.error = error
+                return
+
+            RenderThread.frames += 1
+
+    @staticmethod
+    def stop():
+        thread = RenderThread.thread
+
+        try:
+            RenderThread.put(None)
+            thread.join()
+        finally:
+            RenderThread.thread = None
+
+        if RenderThread.error != None:
+            raise RenderThread.error
+
+    @staticmethod
+    def stats() -> dict[str, float]:
+        return {
+            "frames": RenderThread.frames,
+            "simulation_wait_ms": round(RenderThread.producer_wait * 1000, 1),
+            "render_wait_ms": round(RenderThread.consumer_wait * 1000, 1)
+        }
+
+class TextureRenderer:
+    """
+    RENDER_BACKEND_SDL2 backend, draws the draw lists of `RenderQueue.collect()` through `pygame._sdl2.video`.\n
+    Every surface is uploaded once to a `Texture`, then each frame is cleared and redrawn whole with `Texture.draw`,
+    at the logical resolution that the renderer upscales to the window.
+    """
+    window = None
+    renderer = None
+    textures : dict[pygame.Surface, object] = {}
+
+    @staticmethod
+    def init(title : str, size : tuple[int, int], logical_size : tuple[int, int], software : bool = False):
+        from pygame._sdl2.video import Window as VideoWindow, Renderer
+
+        TextureRenderer.window = VideoWindow(title, size=size)
+        TextureRenderer.renderer = Renderer(TextureRenderer.window, accelerated=0 if software else -1)
+        TextureRenderer.renderer.logical_size = logical_size
+
+    @staticmethod
+    def texture_of(surface : pygame.Surface):
+        texture = TextureRenderer.textures.get(surface, None)
+
+        if texture == None:
+            from pygame._sdl2.video import Texture
+
+            texture = Texture.from_surface(TextureRenderer.renderer, surface)
+            TextureRenderer.textures[surface] = texture
+
+        return texture
+
+    @staticmethod
+    def forget(surfaces : list[pygame.Surface]):
+        """
+        Drops the textures of `surfaces` that are being replaced, a surface drawn again is simply uploaded again.
+        """
+        for surface in surfaces:
+            TextureRenderer.textures.pop(surface, None)
+
+    @staticmethod
+    def draw(draw_list : tuple):
+        renderer = TextureRenderer.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        for surface, position in draw_list[0]:
+            TextureRenderer.texture_of(surface).draw(dstrect=position)
+
+        renderer.present()
+
+class SpatialHash:
+    """
+    Uniform grid that indexes `GameObject`s by the cells their rect overlaps.\n
+    Call `self.update(obj)` whenever the rect of `obj` may have moved, it only touches the grid if the covered cells changed.
+    """
+    def __init__(self, cell_size : int):
+        self.cell_size = cell_size
+        self.cells : dict[tuple[int, int], set[GameObject]] = {}
+        self.entries : dict[GameObject, tuple[int, tuple[int, int, int, int]]] = {}
+        self.next_serial = 0
+
+    def cells_of(self, rect : pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def update(self, obj : 'GameObject'):
+        entry = self.entries.get(obj, None)
+        bounds = self.cells_of(obj.rect)
+
+        if entry == None:
+            serial = self.next_serial
+            self.next_serial += 1
+        elif entry[1] == bounds:
+            return
+        else:
+            serial = entry[0]
+            self.unlink(obj, entry[1])
+
+        self.entries[obj] = (serial, bounds)
+        left, top, right, bottom = bounds
+
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy), None)
+
+                if cell == None:
+                    self.cells[(cx, cy)] = {obj}
+                else:
+                    cell.add(obj)
+
+    def remove(self, obj : 'GameObject'):
+        entry = self.entries.pop(obj, None)
+
+        if entry != None:
+            self.unlink(obj, entry[1])
+
+    def unlink(self, obj : 'GameObject', bounds : tuple[int, int, int, int]):
+        left, top, right, bottom = bounds
+
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells[(cx, cy)]
+                cell.discard(obj)
+
+                if len(cell) == 0:
+                    del self.cells[(cx, cy)]
+
+    def query(self, rect : pygame.Rect) -> set['GameObject']:
+        left, top, right, bottom = self.cells_of(rect)
+        found : set[GameObject] = set()
+
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy), None)
+
+                if cell != None:
+                    found.update(cell)
+
+        return found
+
+    def serial_of(self, obj : 'GameObject') -> int:
+        return self.entries[obj][0]
+
+class Pool:
+    """
+    Free list of destroyed `GameObject`s that are reset and reused instead of allocated again.\n
+    `hits` counts the spawns served by a recycled instance, `misses` the ones that had to allocate a new one.
+    """
+    pools : list['Pool'] = []
+
+    def __init__(self, name : str):
+        self.name = name
+        self.free : list[GameObject] = []
+        self.hits = 0
+        self.misses = 0
+
+        Pool.pools.append(self)
+
+    def acquire(self) -> 'GameObject':
+        if len(self.free) == 0:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self.free.pop()
+
+    def release(self, game_object : 'GameObject'):
+        self.free.append(game_object)
+
+    @staticmethod
+    def stats() -> dict[str, dict[str, int]]:
+        return {pool.name: {"hits": pool.hits, "misses": pool.misses, "free": len(pool.free)} for pool in Pool.pools}
+
 class Context:
-    def __init__(self):
+    def __init__(self, collision_matrix : dict[str, list[str]] = {}, despawn_policy : dict[str, tuple[int, int]] = {}, static : bool = False):
+        from config import SPATIAL_HASH_CELL_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
+
+        self.collision_matrix = collision_matrix
         self.game_objects : dict[str, list[GameObject]] = {}
+        self.spatial_hash = SpatialHash(SPATIAL_HASH_CELL_SIZE)
 
-    def update(self):
+        # Objects drawn outside the window are culled, see `despawn_policy` in `simulate()` for the ones updated outside it
+        self.visible_rect = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.despawn_policy = {
+            tag: (self.visible_rect.inflate(margin * 2, margin * 2), lifetime)
+            for tag, (margin, lifetime) in despawn_policy.items()
+        }
+        self.despawned : dict[str, int] = {}
+        # Objects reclaimed by `sweep()` so far, per tag
+        self.reclaimed : dict[str, int] = {}
+
+        # A static context's objects only change by being appended or swept, `revision` counts those changes.
+        # Its render is baked once per revision and theme into one surface per layer, see `render()`
+        self.static = static
+        self.revision = 0
+        self.render_cache : dict[int, pygame.Surface] = {}
+        self.render_cache_key : tuple[int, int] = None
+
+    def simulate(self):
+        """
+        Runs the game logic of one frame: updates every alive object, resolves the collisions and sweeps the destroyed objects.\n
+        Objects of a tag in the despawn policy are destroyed once they leave its bounds or outlive its lifetime.
+        """
         tags = list(self.game_objects.keys())
+        now = get_ticks()
 
         for tag in tags:
             index = 0
             bucket = self.game_objects[tag]
+            policy = self.despawn_policy.get(tag, None)
 
             while index < len(bucket):
                 obj = bucket[index]
+                index += 1
 
                 if obj.destroyed:
-                    bucket.pop(index)
                     continue
 
-                obj.on_render()
                 obj.update()
-                index += 1
+
+                if policy != None and not obj.destroyed:
+                    bounds, lifetime = policy
+
+                    if not bounds.colliderect(obj.rect) or (lifetime != -1 and now - obj.created_time >= lifetime):
+                        obj.destroy()
+                        self.despawned[tag] = self.despawned.get(tag, 0) + 1
+
+                self.spatial_hash.update(obj)
+
+        self.resolve_collisions()
+        self.sweep()
+
+    def render(self):
+        """
+        Draws every alive object as the last `simulate()` left it. Skipping it doesn't affect movement nor collisions, but the default
+        animator of `SpaceImpactObject` steps in `on_render()`, so an animation only advances while its object is drawn
+        (never in headless runs, nor while the object is culled).\n
+        Objects drawn entirely outside the window are culled.\n
+        A static context submits its cached surfaces instead, rebaking them after objects were appended or swept or the theme changed.
+        """
+        if self.static:
+            key = (self.revision, Sprite.variant)
+
+            if self.render_cache_key != key:
+                TextureRenderer.forget(list(self.render_cache.values()))
+                self.render_cache = self.bake()
+                self.render_cache_key = key
+
+            for layer, surface in self.render_cache.items():
+                RenderQueue.submit(layer, surface, (0, 0))
+
+            return
+
+        self.render_objects()
+
+    def render_objects(self):
+        visible_rect = self.visible_rect
+
+        for bucket in list(self.game_objects.values()):
+            for obj in bucket:
+                if not obj.destroyed and visible_rect.colliderect(obj.render_bounds()):
+                    obj.on_render()
+
+    def bake(self) -> dict[int, pygame.Surface]:
+        """
+        Renders the objects into a transparent framebuffer sized surface per layer, RLE accelerated as the tinted sprites are.
+        """
+        from config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+        layers = RenderQueue.layers
+        RenderQueue.layers = {}
+        self.render_objects()
+        captured = RenderQueue.layers
+        RenderQueue.layers = layers
+
+        size = (WINDOW_WIDTH // Window.scale, WINDOW_HEIGHT // Window.scale)
+        baked : dict[int, pygame.Surface] = {}
+
+        for layer, entries in captured.items():
+            if Window.palette != None:
+                surface = pygame.Surface(size, depth=8)
+                surface.set_palette(Window.palette)
+                surface.fill(0)
+                surface.blits(entries, doreturn=False)
+                surface.set_colorkey(0, pygame.RLEACCEL)
+            else:
+                surface = pygame.Surface(size, pygame.SRCALPHA)
+                surface.blits(entries, doreturn=False)
+                surface = TintCache.accelerate(surface)
+
+            baked[layer] = surface
+
+        return baked
+
+    def resolve_collisions(self):
+        """
+        Tests, once per frame, every pair of overlapping objects whose tags interact according to `self.collision_matrix`
+        and calls `on_collision(other)` on the object tagged with the matrix key.
+        """
+        for tag, others in self.collision_matrix.items():
+            for obj in self.find_with_tag(tag):
+                if obj.destroyed:
+                    continue
+
+                for other in self.query_rect(obj.rect, others):
+                    if obj.collide(other):
+                        obj.on_collision(other)
+
+    def sweep(self) -> dict[str, int]:
+        """
+        Removes every destroyed object, compacting each bucket in a single pass.\n
+        Returns how many objects each tag reclaimed this frame and adds them to `self.reclaimed`.
+        """
+        reclaimed : dict[str, int] = {}
+
+        for tag, bucket in self.game_objects.items():
+            alive : list[GameObject] = []
+
+            for obj in bucket:
+                if obj.destroyed:
+                    self.spatial_hash.remove(obj)
+
+                    if obj.pool != None:
+                        obj.pool.release(obj)
+                else:
+                    alive.append(obj)
+
+            if len(alive) != len(bucket):
+                reclaimed[tag] = len(bucket) - len(alive)
+                self.reclaimed[tag] = self.reclaimed.get(tag, 0) + reclaimed[tag]
+                bucket[:] = alive
+
+        if len(reclaimed) != 0:
+            self.revision += 1
+
+        return reclaimed
 
     def append(self, game_object : 'GameObject'):
         bucket = self.game_objects.get(game_object.tag, None)
@@ -92,6 +1364,9 @@ class Context:
         else:
             bucket.append(game_object)
 
+        self.spatial_hash.update(game_object)
+        self.revision += 1
+
     def find_with_tag(self, tag : str) -> list['GameObject']:
         return self.game_objects.get(tag, [])
     
@@ -103,7 +1378,69 @@ class Context:
         
         return found
 
+    def memory_usage(self) -> dict[str, int]:
+        """
+        Returns, for each tag, the average bytes taken by a live object: the instance itself plus its `__dict__`, if it has one.
+        """
+        usage : dict[str, int] = {}
+
+        for tag, bucket in self.game_objects.items():
+            alive = [obj for obj in bucket if not obj.destroyed]
+
+            if len(alive) == 0:
+                continue
+
+            total = 0
+
+            for obj in alive:
+                total += sys.getsizeof(obj)
+
+                if hasattr(obj, "__dict__"):
+                    total += sys.getsizeof(obj.__dict__)
+
+            usage[tag] = total // len(alive)
+
+        return usage
+
+    def query_rect(self, rect : pygame.Rect, tags : list[str] = None) -> list['GameObject']:
+        """
+        Returns the alive objects whose rect collides with `rect`, optionally filtered by `tags`.\n
+        Only the objects indexed in the cells covered by `rect` are tested, results keep the `find_with_tags` order.
+        """
+        found = [
+            obj for obj in self.spatial_hash.query(rect)
+            if not obj.destroyed and (tags == None or obj.tag in tags) and obj.rect.colliderect(rect)
+        ]
+
+        return self.sorted_by_tags(found, tags)
+
+    def query_point(self, x : int, y : int, tags : list[str] = None) -> list['GameObject']:
+        """
+        Returns the alive objects whose rect contains the point (`x`, `y`), optionally filtered by `tags`.
+        """
+        found = [
+            obj for obj in self.spatial_hash.query(pygame.Rect(x, y, 1, 1))
+            if not obj.destroyed and (tags == None or obj.tag in tags) and obj.rect.collidepoint(x, y)
+        ]
+
+        return self.sorted_by_tags(found, tags)
+
+    def sorted_by_tags(self, found : list['GameObject'], tags : list[str]) -> list['GameObject']:
+        serial_of = self.spatial_hash.serial_of
+
+        if tags == None:
+            found.sort(key=serial_of)
+        else:
+            found.sort(key=lambda obj: (tags.index(obj.tag), serial_of(obj)))
+
+        return found
+
 class GameObject:
+    __slots__ = ("__show_rects__", "context", "rect", "rect_color", "sprite", "tag", "layer", "hidden", "destroyed", "created_time")
+
+    # Pooled subclasses set this to a `Pool`: once swept, their instances are recycled by `spawn()`
+    pool : Pool = None
+
     def __init__(
             self,
             context : Context,
@@ -113,7 +1450,8 @@ class GameObject:
             height : int = 0,
             tag : str = None,
             sprite: Sprite = None,
-            rect_color : tuple[int, int, int] = (0, 0, 0)
+            rect_color : tuple[int, int, int] = (0, 0, 0),
+            layer : int = 0
         ):
 
         from config import DEBUG_SHOW_RECTS
@@ -124,21 +1462,77 @@ class GameObject:
         self.rect_color = rect_color
         self.sprite = sprite
         self.tag = tag
+        self.layer = layer
 
         self.hidden = False
         self.destroyed = False
+        self.created_time = get_ticks()
 
         context.append(self)
 
+    @classmethod
+    def spawn(cls, *args, **kwargs) -> 'GameObject':
+        """
+        Same as calling the constructor, but reuses a recycled instance from `cls.pool` when one is available.
+        """
+        game_object = None if cls.pool == None else cls.pool.acquire()
+
+        if game_object == None:
+            return cls(*args, **kwargs)
+
+        game_object.revive(*args, **kwargs)
+        game_object.context.append(game_object)
+
+        return game_object
+
+    def revive(self, context : Context, x : int = 0, y : int = 0, tag : str = None):
+        """
+        Resets the state of a recycled instance, pooled subclasses override it with the same signature of their constructor.
+        """
+        self.context = context
+        self.rect.x = x
+        self.rect.y = y
+        self.tag = tag
+
+        self.hidden = False
+        self.destroyed = False
+        self.created_time = get_ticks()
+
+    def render_bounds(self) -> pygame.Rect:
+        """
+        Area covered by the rect and the sprite, in window pixels.\n
+        Culling must not load nor touch the sprite, one that isn't loaded is bounded by its untrimmed size instead.
+        """
+        sprite = self.sprite
+
+        if sprite == None:
+            return self.rect
+
+        if sprite.tinted == None:
+            if sprite.size == None:
+                return self.rect
+
+            return self.rect.union((self.rect.x, self.rect.y, sprite.size[0], sprite.size[1]))
+
+        offset = sprite.trim_offset
+        width, height = sprite.tinted.get_size()
+        scale = Window.scale
+
+        return self.rect.union((self.rect.x + offset[0], self.rect.y + offset[1], width * scale, height * scale))
+
     def on_render(self):
         if self.__show_rects__:
-            pygame.draw.rect(Window.screen, self.rect_color, self.rect)
+            RenderQueue.submit_rect(self.layer, self.rect_color, self.rect)
         if self.sprite != None and not self.hidden:
-            Window.screen.blit(self.sprite.surface, self.rect)
+            offset = self.sprite.offset
+            RenderQueue.submit(self.layer, self.sprite.surface, (self.rect.x + offset[0], self.rect.y + offset[1]))
 
     def update(self):
         pass
 
+    def on_collision(self, other : 'GameObject'):
+        pass
+
     def destroy(self):
         self.destroyed = True
 
@@ -163,15 +1557,27 @@ class Font:
         self.char_width = char_width
         self.char_height = char_height
         self.char_gap = char_gap
+        self.glyphs : dict[tuple[str, int], pygame.Surface] = {}
     
     def get_sprite(self, char : str, font_size : int) -> Sprite:
-        item = self.font_map[char]
-        coords = item["coords"]
-        width = item["width"]
+        """
+        Scaled glyphs are cached, so every sprite of the same character and size shares its source surface and tinted copies.
+        """
+        glyph = self.glyphs.get((char, font_size), None)
 
-        return Sprite.from_surface(self.font_source.get_sprite(coords[0], coords[1], width, self.char_height).surface, width * font_size, self.char_height * font_size)
+        if glyph == None:
+            item = self.font_map[char]
+            coords = item["coords"]
+            width = item["width"]
+
+            glyph = Sprite.from_surface(self.font_source.get_sprite(coords[0], coords[1], width, self.char_height).surface, width * font_size, self.char_height * font_size).surface
+            self.glyphs[(char, font_size)] = glyph
+
+        return Sprite(glyph)
 
 class Text(GameObject):
+    __slots__ = ("__font_rect_color__", "font", "font_size", "font_gap", "x", "y", "characters", "width", "height")
+
     def __init__(
             self,
             context : Context,
@@ -183,8 +1589,9 @@ class Text(GameObject):
             context = context
         )
 
-        from config import FONT_RECT_COLOR
+        from config import FONT_RECT_COLOR, LAYER_HUD
         self.__font_rect_color__ = FONT_RECT_COLOR
+        self.layer = LAYER_HUD
 
         self.context = context
         self.font = font
@@ -218,7 +1625,8 @@ class Text(GameObject):
                 width = rect_width,
                 height = self.height,
                 sprite = sprite,
-                rect_color = self.__font_rect_color__
+                rect_color = self.__font_rect_color__,
+                layer = self.layer
             )
 
             self.characters.append(text_char)
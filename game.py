@@ -1,5 +1,4 @@
 from utils import clamp, int_b, center_y
-from pygame.time import get_ticks
 from core import *
 from config import *
 from typing import cast
@@ -9,25 +8,30 @@ import random
 class GameManager:
     objects_tint = NOKIA_LIGHT_COLOR
     wallpaper = VOID_WALLPAPER
+    background = ScrollingWallpaper(WALLPAPER_SPEEDS)
     game_over : bool = False
 
     @staticmethod
     def set_theme(theme : str, wallpaper : Sprite):
         GameManager.wallpaper = wallpaper
 
-        if theme == NOKIA_LIGHT:
-            GameManager.objects_tint = NOKIA_DARK_COLOR
-        else:
-            GameManager.objects_tint = NOKIA_LIGHT_COLOR
+        Sprite.variant = THEMES.index(theme)
+        GameManager.objects_tint = THEME_TINTS[Sprite.variant]
+        Window.set_ink(GameManager.objects_tint)
 
         wallpaper.tint(NOKIA_LIGHT_COLOR)
+        GameManager.background.set_source(wallpaper.surface)
+        RenderQueue.invalidate()
 
     @staticmethod
-    def update():
-        if GameManager.wallpaper != None:
-            Window.screen.blit(GameManager.wallpaper.surface, (0, 0))
+    def render():
+        GameManager.background.update(get_ticks())
 
 class SpaceImpactObject(GameObject):
+    __slots__ = ("current_animation", "animations", "default_animator", "animations_interval", "last_animation_time")
+    # Sprites an instance may draw, loaded ahead by `LevelManager.preload()` for the levels spawning the class
+    ASSETS : list[Sprite] = []
+
     def __init__(
             self,
             context : Context,
@@ -37,16 +41,17 @@ class SpaceImpactObject(GameObject):
             height : int = 0,
             tag : str = None,
             animations: list[Sprite] = [],
-            rect_color : tuple[int, int, int] = (0, 0, 0)
+            rect_color : tuple[int, int, int] = (0, 0, 0),
+            layer : int = 0
         ):
 
-        self.current_tint = GameManager.objects_tint
-
         self.current_animation = 0
         self.animations = animations
 
+        # Animations are shared by every instance, only the first one prepares their variants
         for animation in self.animations:
-            animation.tint(self.current_tint)
+            if animation.variants == None:
+                animation.prepare_variants(THEME_TINTS)
 
         super().__init__(
             context = context,
@@ -56,21 +61,30 @@ class SpaceImpactObject(GameObject):
             height = height,
             tag = tag,
             sprite = animations[self.current_animation],
-            rect_color = rect_color
+            rect_color = rect_color,
+            layer = layer
         )
 
         self.default_animator = False
         self.animations_interval = -1
         self.last_animation_time = -1
 
+    def revive(self, context : Context, x : int = 0, y : int = 0, tag : str = None):
+        super().revive(
+            context = context,
+            x = x,
+            y = y,
+            tag = tag
+        )
+
+        self.current_animation = 0
+        self.sprite = self.animations[self.current_animation]
+
+        if self.default_animator:
+            self.last_animation_time = get_ticks()
+
     def on_render(self):
         super().on_render()
-    
-        if self.current_tint != GameManager.objects_tint:
-            self.current_tint = GameManager.objects_tint
-
-            for animation in self.animations:
-                animation.tint(self.current_tint)
 
         if self.default_animator:
             if get_ticks() - self.last_animation_time >= self.animations_interval:
@@ -87,6 +101,8 @@ class SpaceImpactObject(GameObject):
         self.last_animation_time = get_ticks()
 
 class Player(SpaceImpactObject):
+    __slots__ = ("__lives_text__", "__score_text__", "__weapon_text__", "__game_over_score_value_text__", "current_weapon", "_lives", "_rockets", "_lasers", "_score", "shield_powerup", "flight_mode", "flight_speed", "last_shoot_time_hold")
+
     def __init__(self, context : Context):
         super().__init__(
             context = context,
@@ -94,8 +110,10 @@ class Player(SpaceImpactObject):
             y = PLAYER_SPAWN_Y,
             width = BATTLE_SHIP_RECT_WIDTH,
             height = BATTLE_SHIP_RECT_HEIGHT,
+            tag = TAG_PLAYER,
             animations = BATTLE_SHIP_ANIMATIONS,
-            rect_color = BATTLE_SHIP_RECT_COLOR
+            rect_color = BATTLE_SHIP_RECT_COLOR,
+            layer = LAYER_PLAYER
         )
 
         from scene import lives_text, weapon_text, score_text, game_over_score_value_text
@@ -193,7 +211,7 @@ class Player(SpaceImpactObject):
             self.__weapon_text__.set_weapon(weapon, self.lasers)
 
     def shoot(self):
-        Pew(
+        Pew.spawn(
             self.context,
             self.rect.x + self.rect.width, 
             self.rect.y + (self.rect.height - PROJECTILE_PEW_RECT_HEIGHT) // 2, 
@@ -214,7 +232,7 @@ class Player(SpaceImpactObject):
         self.rockets -= 1
         self.__weapon_text__.set_amount(self.rockets)
 
-        RocketProjectile(
+        RocketProjectile.spawn(
             self.context,
             self.rect.x + self.rect.width,
             self.rect.y + (self.rect.height - PROJECTILE_ROCKET_RECT_HEIGHT) // 2,
@@ -264,6 +282,8 @@ class Bouncy(SpaceImpactObject):
     Represents a moving object that bounces between `MAP_TOP_BOUND` and `MAP_LEFT_BOUND`.\n
     Call `self.move()` in update to make the object move every frame.
     """
+    __slots__ = ("horizontal_speed", "vertical_speed", "horizontal_direction", "vertical_direction", "horizontal_stop_distance", "vertical_stop_speed", "has_stopped")
+
     def __init__(
             self,
             context : Context,
@@ -303,6 +323,37 @@ class Bouncy(SpaceImpactObject):
 
         self.rect.y = clamp(self.rect.y, MAP_TOP_BOUND, MAP_BOTTOM_BOUND - self.rect.height)
 
+    def revive(
+            self,
+            context : Context,
+            x : int = 0,
+            y : int = 0,
+            tag : str = "",
+
+            horizontal_speed : int = 0,
+            vertical_speed : int = 0,
+            horizontal_direction : str = LEFT,
+            vertical_direction : str = UP
+        ):
+
+        super().revive(
+            context = context,
+            x = x,
+            y = y,
+            tag = tag
+        )
+
+        self.horizontal_speed = horizontal_speed
+        self.vertical_speed = vertical_speed
+        self.horizontal_direction = horizontal_direction
+        self.vertical_direction = vertical_direction
+
+        self.horizontal_stop_distance = BOUNCY_DEFAULT_HORIZONTAL_STOP_DISTANCE
+        self.vertical_stop_speed = BOUNCY_DEFAULT_VERTICAL_STOP_SPEED
+        self.has_stopped = False
+
+        self.rect.y = clamp(self.rect.y, MAP_TOP_BOUND, MAP_BOTTOM_BOUND - self.rect.height)
+
     def move(self):
         if self.horizontal_direction == LEFT:
             self.rect.x -= self.horizontal_speed
@@ -335,6 +386,8 @@ class Bouncy(SpaceImpactObject):
             self.destroy()
 
 class Living(Bouncy):
+    __slots__ = ("health", "max_health", "__health_bar_under", "__health_bar_over")
+
     def __init__(
             self,
             context : Context,
@@ -377,8 +430,38 @@ class Living(Bouncy):
             self.__health_bar_under = pygame.Rect(self.rect.x, self.rect.y - HEALTH_BAR_OFFSET_Y, self.rect.width, HEALTH_BAR_HEIGHT)
             self.__health_bar_over = pygame.Rect(self.rect.x, self.rect.y - HEALTH_BAR_OFFSET_Y, self.rect.width, HEALTH_BAR_HEIGHT)
 
-    def update(self):
-        super().update()
+    def revive(
+            self,
+            context : Context,
+            x : int,
+            y : int,
+            tag : str,
+
+            horizontal_speed : int,
+            vertical_speed : int,
+            horizontal_direction : str,
+            vertical_direction : str,
+
+            health : int
+        ):
+
+        super().revive(
+            context = context,
+            x = x,
+            y = y,
+            tag = tag,
+
+            horizontal_speed = horizontal_speed,
+            vertical_speed = vertical_speed,
+            horizontal_direction = horizontal_direction,
+            vertical_direction = vertical_direction
+        )
+
+        self.health = health
+        self.max_health = health
+
+    def on_render(self):
+        super().on_render()
 
         if DEBUG_SHOW_HEALTH_BARS:
             self.__debug()
@@ -390,7 +473,7 @@ class Living(Bouncy):
             self.pop()
     
     def pop(self):
-        Pop(self.context, 
+        Pop.spawn(self.context, 
             self.rect.x + (self.rect.width - POP_RECT_WIDTH) // 2, 
             self.rect.y + (self.rect.height - POP_RECT_HEIGHT) // 2
         )
@@ -404,10 +487,12 @@ class Living(Bouncy):
         self.__health_bar_over.y = self.rect.y - HEALTH_BAR_OFFSET_Y
         self.__health_bar_over.width = (self.health / self.max_health) * self.__health_bar_under.width
 
-        pygame.draw.rect(Window.screen, (128, 128, 128), self.__health_bar_under)
-        pygame.draw.rect(Window.screen, (255, 0, 0), self.__health_bar_over)
+        RenderQueue.submit_rect(LAYER_HUD, (128, 128, 128), self.__health_bar_under)
+        RenderQueue.submit_rect(LAYER_HUD, (255, 0, 0), self.__health_bar_over)
 
 class Enemy(Living):
+    __slots__ = ("__player__", "hit_reward", "pop_reward", "shoot_chance", "last_shoot_time")
+
     def __init__(
             self,
             context : Context,
@@ -445,6 +530,8 @@ class Enemy(Living):
             health = health
         )
 
+        self.layer = LAYER_ENEMIES
+
         from scene import player
         self.__player__ = player
 
@@ -465,10 +552,10 @@ class Enemy(Living):
 
         self.shoot()
         self.move()
-        
-        if self.collide(self.__player__):
-            self.on_player_collision()
     
+    def on_collision(self, other : GameObject):
+        self.on_player_collision()
+
     def move(self):
         super().move()
     
@@ -479,7 +566,7 @@ class Enemy(Living):
         roll = random.randint(1, 100)
 
         if roll <= self.shoot_chance:
-            Pew(
+            Pew.spawn(
                 self.context, 
                 self.rect.x - self.rect.width // 4, 
                 self.rect.y + (self.rect.height - PROJECTILE_PEW_RECT_HEIGHT) // 2,
@@ -504,6 +591,9 @@ class Enemy(Living):
         self.pop()
 
 class Comet(Enemy):
+    __slots__ = ()
+    ASSETS = COMET_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -537,6 +627,9 @@ class Comet(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Shuttle(Enemy):
+    __slots__ = ()
+    ASSETS = SHUTTLE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -570,6 +663,9 @@ class Shuttle(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class VShip(Enemy):
+    __slots__ = ()
+    ASSETS = VSHIP_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -603,6 +699,9 @@ class VShip(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Rocket(Enemy):
+    __slots__ = ()
+    ASSETS = ROCKET_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -636,6 +735,9 @@ class Rocket(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Acorn(Enemy):
+    __slots__ = ()
+    ASSETS = ACORN_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -669,6 +771,9 @@ class Acorn(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Snake(Enemy):
+    __slots__ = ()
+    ASSETS = SNAKE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -702,6 +807,9 @@ class Snake(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Drone(Enemy):
+    __slots__ = ()
+    ASSETS = DRONE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -735,6 +843,9 @@ class Drone(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Virus(Enemy):
+    __slots__ = ()
+    ASSETS = VIRUS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -774,6 +885,9 @@ class Virus(Enemy):
             self.shoot_chance = 100
 
 class Cockroach(Enemy):
+    __slots__ = ()
+    ASSETS = COCKROACH_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -807,6 +921,9 @@ class Cockroach(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Bean(Enemy):
+    __slots__ = ()
+    ASSETS = BEAN_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -840,6 +957,9 @@ class Bean(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Star(Enemy):
+    __slots__ = ()
+    ASSETS = STAR_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -873,6 +993,9 @@ class Star(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class Centipede(Enemy):
+    __slots__ = ()
+    ASSETS = CENTIPEDE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -906,6 +1029,8 @@ class Centipede(Enemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", BOUNCY_DEFAULT_VERTICAL_STOP_SPEED)
 
 class BossEnemy(Enemy):    
+    __slots__ = ("blink_start_time", "blink_duration")
+
     def __init__(
             self,
             context : Context,
@@ -962,6 +1087,9 @@ class BossEnemy(Enemy):
             self.blink_start_time = get_ticks()
 
 class AlienJellyfishBoss(BossEnemy):
+    __slots__ = ()
+    ASSETS = ALIEN_JELLYFISH_BOSS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -995,6 +1123,9 @@ class AlienJellyfishBoss(BossEnemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", ALIEN_JELLYFISH_BOSS_VERTICAL_STOP_SPEED)
 
 class PythonBoss(BossEnemy):
+    __slots__ = ()
+    ASSETS = PYTHON_BOSS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1028,6 +1159,9 @@ class PythonBoss(BossEnemy):
         self.vertical_stop_speed = overrides.get("vertical_stop_speed", PYTHON_BOSS_VERTICAL_STOP_SPEED)
 
 class PiranhaBoss(BossEnemy):
+    __slots__ = ("casting", "ability_position_phase", "ability_shoot_phase", "ability_last_shoot_time", "ability_shots_done", "ability_projectiles_distance", "ability_shoot_pos", "ability_last_cast_time")
+    ASSETS = PIRANHA_BOSS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1103,7 +1237,7 @@ class PiranhaBoss(BossEnemy):
         elif self.ability_shoot_phase and get_ticks() - self.ability_last_shoot_time >= PIRANHA_BOSS_ABILITY_SHOOT_INTERVAL:
             for i in range(0, PIRANHA_BOSS_ABILITY_PROJECTILES_COUNT):
                 if i == 0:
-                    Pew(
+                    Pew.spawn(
                         self.context,
                         self.rect.x - 8,
                         self.rect.centery,
@@ -1111,7 +1245,7 @@ class PiranhaBoss(BossEnemy):
                         LEFT
                     )            
                 elif i % 2 == 0:
-                    Pew(
+                    Pew.spawn(
                         self.context,
                         self.rect.x - 8,
                         self.rect.centery + i * self.ability_projectiles_distance,
@@ -1119,7 +1253,7 @@ class PiranhaBoss(BossEnemy):
                         LEFT
                     )
                 else:
-                    Pew(
+                    Pew.spawn(
                         self.context,
                         self.rect.x - 8,
                         self.rect.centery - i * self.ability_projectiles_distance - PROJECTILE_PEW_RECT_HEIGHT * 2,
@@ -1137,6 +1271,9 @@ class PiranhaBoss(BossEnemy):
                 self.ability_last_cast_time = get_ticks()
 
 class YotsuBoss(BossEnemy):
+    __slots__ = ("ability_last_cast_time", "drone_minions")
+    ASSETS = YOTSU_BOSS_ANIMATIONS + DRONE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1225,6 +1362,9 @@ class YotsuBoss(BossEnemy):
         return False
 
 class PufferfishBoss(BossEnemy):
+    __slots__ = ("ability_last_cast_time", "is_casting", "current_charge_velocity", "current_charge_direction")
+    ASSETS = PUFFERFISH_BOSS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1319,6 +1459,9 @@ class PufferfishBoss(BossEnemy):
                     self.ability_last_cast_time = get_ticks()
 
 class ShellBoss(BossEnemy):
+    __slots__ = ("ability_last_cast_time", "is_casting", "ability_last_summon_time", "summoned_minions_count")
+    ASSETS = SHELL_BOSS_ANIMATIONS + COCKROACH_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1390,6 +1533,9 @@ class ShellBoss(BossEnemy):
 
 # Forgive me, code is basically the same of Pufferfish boss 🙏.
 class SquidBoss(BossEnemy):
+    __slots__ = ("ability_last_cast_time", "is_casting", "is_retreating", "current_charge_velocity", "current_charge_direction")
+    ASSETS = SQUID_BOSS_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1497,6 +1643,9 @@ class SquidBoss(BossEnemy):
                                     right_stop_x)
 
 class KrakenBoss(BossEnemy):
+    __slots__ = ("is_casting", "is_retreating", "ability_last_cast_time")
+    ASSETS = KRAKEN_BOSS_ANIMATIONS + CENTIPEDE_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1571,6 +1720,8 @@ class KrakenBoss(BossEnemy):
             self.ability_last_cast_time = get_ticks()
 
 class Projectile(Living):
+    __slots__ = ("__player__", "hit_damage", "hit_reward", "pop_reward")
+
     def __init__(
         self,
         context : Context,
@@ -1611,6 +1762,8 @@ class Projectile(Living):
             health = health
         )
 
+        self.layer = LAYER_PROJECTILES
+
         from scene import player
         self.__player__ = player
 
@@ -1624,20 +1777,15 @@ class Projectile(Living):
     
     def update(self):
         self.move()
-        self.check_collisions()
 
-    def check_collisions(self):
+    def on_collision(self, other : GameObject):
         if self.tag == TAG_PROJECTILE_PLAYER:
-            for enemy in self.context.find_with_tags([TAG_ENEMY, TAG_PROJECTILE_ENEMY]):
-                if self.collide(enemy):
-                    enemy = cast(Enemy, enemy)
-                    enemy.damage(self.hit_damage)
-
-                    self.destroy()
+            enemy = cast(Living, other)
+            enemy.damage(self.hit_damage)
         elif self.tag == TAG_PROJECTILE_ENEMY:
-            if self.collide(self.__player__):
-                self.__player__.damage()
-                self.destroy()
+            self.__player__.damage()
+
+        self.destroy()
 
     def damage(self, amount : int):
         super().damage(amount)
@@ -1649,6 +1797,10 @@ class Projectile(Living):
                 self.__player__.score += self.pop_reward
 
 class Pew(Projectile):
+    __slots__ = ()
+
+    pool = Pool("pew")
+
     def __init__(
             self,
             context : Context,
@@ -1680,7 +1832,34 @@ class Pew(Projectile):
             pop_reward = PROJECTILE_PEW_POP_REWARD
         )
 
+    def revive(
+            self,
+            context : Context,
+            x : int,
+            y : int,
+            tag : str,
+            horizontal_direction : str,
+        ):
+
+        super().revive(
+            context = context,
+            x = x,
+            y = y,
+            tag = tag,
+
+            horizontal_speed = PROJECTILE_PEW_HORIZONTAL_SPEED,
+            vertical_speed = PROJECTILE_PEW_VERTICAL_SPEED,
+            horizontal_direction = horizontal_direction,
+            vertical_direction = UP,
+
+            health = PROJECTILE_PEW_HEALTH
+        )
+
 class RocketProjectile(Projectile):
+    __slots__ = ()
+
+    pool = Pool("rocket_projectile")
+
     def __init__(
             self,
             context : Context,
@@ -1712,7 +1891,32 @@ class RocketProjectile(Projectile):
             pop_reward = PROJECTILE_ROCKET_POP_REWARD
         )
 
+    def revive(
+            self,
+            context : Context,
+            x : int,
+            y : int,
+            tag : str,
+            horizontal_direction : str,
+        ):
+
+        super().revive(
+            context = context,
+            x = x,
+            y = y,
+            tag = tag,
+
+            horizontal_speed = PROJECTILE_ROCKET_HORIZONTAL_SPEED,
+            vertical_speed = PROJECTILE_ROCKET_VERTICAL_SPEED,
+            horizontal_direction = horizontal_direction,
+            vertical_direction = UP if random.randint(0, 1) == 0 else DOWN,
+
+            health = PROJECTILE_ROCKET_HEALTH
+        )
+
 class Laser(SpaceImpactObject):
+    __slots__ = ("spawn_time",)
+
     def __init__(
             self,
             context : Context,
@@ -1729,10 +1933,11 @@ class Laser(SpaceImpactObject):
             width = PROJECTILE_LASER_RECT_WIDTH,
             height = PROJECTILE_LASER_RECT_HEIGHT,
             animations = PROJECTILE_LASER_ANIMATIONS,
-            rect_color = PROJECTILE_LASER_RECT_COLOR
+            rect_color = PROJECTILE_LASER_RECT_COLOR,
+            layer = LAYER_PROJECTILES
         )
         
-        for enemy in context.find_with_tags([TAG_ENEMY, TAG_PROJECTILE_ENEMY]):
+        for enemy in context.query_rect(self.rect, [TAG_ENEMY, TAG_PROJECTILE_ENEMY]):
             enemy = cast(Living, enemy)
 
             if self.collide(enemy):
@@ -1743,6 +1948,10 @@ class Laser(SpaceImpactObject):
             self.destroy()
 
 class Pop(SpaceImpactObject):
+    __slots__ = ("spawn_time",)
+
+    pool = Pool("pop")
+
     def __init__(
         self,
         context : Context,
@@ -1756,7 +1965,8 @@ class Pop(SpaceImpactObject):
             width = POP_RECT_WIDTH,
             height = POP_RECT_HEIGHT,
             animations = POP_ANIMATIONS,
-            rect_color = POP_RECT_COLOR
+            rect_color = POP_RECT_COLOR,
+            layer = LAYER_ENEMIES
         )
 
         self.spawn_time = get_ticks()
@@ -1765,11 +1975,29 @@ class Pop(SpaceImpactObject):
 
         self.use_default_animator(self.animations_interval)
 
+    def revive(
+        self,
+        context : Context,
+        x : int,
+        y : int
+    ):
+        super().revive(
+            context = context,
+            x = x,
+            y = y
+        )
+
+        self.spawn_time = get_ticks()
+        self.use_default_animator(self.animations_interval)
+
     def update(self):
         if get_ticks() - self.spawn_time >= POP_DURATION:
             self.destroy()
 
 class EyeOrb(Bouncy):
+    __slots__ = ("__player__", "reward_kind")
+    ASSETS = EYE_ORB_ANIMATIONS
+
     def __init__(
             self,
             context : Context,
@@ -1784,6 +2012,7 @@ class EyeOrb(Bouncy):
             y = y,
             width = EYE_ORB_RECT_WIDTH,
             height = EYE_ORB_RECT_HEIGHT,
+            tag = TAG_PICKUP,
             animations = EYE_ORB_ANIMATIONS,
             rect_color = EYE_ORB_RECT_COLOR,
 
@@ -1793,6 +2022,8 @@ class EyeOrb(Bouncy):
             vertical_direction = UP
         )
 
+        self.layer = LAYER_ENEMIES
+
         from scene import player
         self.__player__ = player
 
@@ -1803,19 +2034,21 @@ class EyeOrb(Bouncy):
     def update(self):
         self.move()
 
-        if self.collide(self.__player__):
-            if self.reward_kind == ROCKETS_REWARD:
-                self.__player__.rockets += EYE_ORB_ROCKETS_REWARD
-                self.__player__.set_weapon(WEAPON_ROCKET)
-            elif self.reward_kind == LASER_REWARD:
-                self.__player__.lasers += EYE_ORB_LASERS_REWARD
-                self.__player__.set_weapon(WEAPON_LASER)
-            elif self.reward_kind == HEALTH_REWARD:
-                self.__player__.lives += 2
+    def on_collision(self, other : GameObject):
+        if self.reward_kind == ROCKETS_REWARD:
+            self.__player__.rockets += EYE_ORB_ROCKETS_REWARD
+            self.__player__.set_weapon(WEAPON_ROCKET)
+        elif self.reward_kind == LASER_REWARD:
+            self.__player__.lasers += EYE_ORB_LASERS_REWARD
+            self.__player__.set_weapon(WEAPON_LASER)
+        elif self.reward_kind == HEALTH_REWARD:
+            self.__player__.lives += 2
 
-            self.destroy()
+        self.destroy()
 
 class BattleshipShield(SpaceImpactObject):
+    __slots__ = ("owner", "start_time")
+
     def __init__(
             self,
             context : Context,
@@ -1829,7 +2062,8 @@ class BattleshipShield(SpaceImpactObject):
             width = BATTLE_SHIP_SHIELD_RECT_WIDTH,
             height = BATTLE_SHIP_SHIELD_RECT_HEIGHT,
             animations = BATTLE_SHIP_SHIELD_ANIMATIONS,
-            rect_color = BATTLE_SHIP_SHIELD_RECT_COLOR
+            rect_color = BATTLE_SHIP_SHIELD_RECT_COLOR,
+            layer = LAYER_SHIELD
         )
 
         self.use_default_animator(BATTLE_SHIP_SHIELD_ANIMATIONS_INTERVAL)
@@ -1843,6 +2077,8 @@ class BattleshipShield(SpaceImpactObject):
             self.destroy()
 
 class ThemeText(Text):
+    __slots__ = ()
+
     def __init__(
             self,
             context : Context,
@@ -1856,27 +2092,18 @@ class ThemeText(Text):
             font_size = font_size
         )
 
-        self.current_tint = GameManager.objects_tint
-
         for char in self.characters:
-            self.current_tint = GameManager.objects_tint
-            char.sprite.tint(self.current_tint)
-
-    def on_render(self):
-        super().on_render()
-
-        if self.current_tint != GameManager.objects_tint:
-            for char in self.characters:
-                self.current_tint = GameManager.objects_tint
-                char.sprite.tint(self.current_tint)
+            char.sprite.prepare_variants(THEME_TINTS)
     
     def set_text(self, value : str):
         super().set_text(value)
 
         for char in self.characters:
-            char.sprite.tint(self.current_tint)
+            char.sprite.prepare_variants(THEME_TINTS)
 
 class LivesText(ThemeText):
+    __slots__ = ()
+
     def __init__(
             self, 
             context : Context,
@@ -1899,6 +2126,8 @@ class LivesText(ThemeText):
             self.set_text("v" + str(value).zfill(2))
 
 class WeaponText(ThemeText):
+    __slots__ = ("weapon",)
+
     def __init__(
             self, 
             context : Context,
@@ -1928,6 +2157,8 @@ class WeaponText(ThemeText):
         self.set_amount(amount)
 
 class ScoreText(ThemeText):
+    __slots__ = ()
+
     def __init__(
             self, 
             context : Context,
@@ -2,7 +2,6 @@ import random
 from core import *
 from config import *
 from utils import random_y, random_vertical_direction, args, center_x
-from pygame.time import get_ticks
 from game import *
 from scene import *
 
@@ -96,6 +95,17 @@ class Level:
             self.is_boss_stage = True
             self.boss = self.boss_cls(**self.cls_args)
 
+    def assets(self) -> list[Sprite]:
+        """
+        Sprites of the wallpaper, the boss and every spawned class of this level.
+        """
+        sprites = [self.wallpaper] + self.boss_cls.ASSETS
+
+        for wave_dict in self.waves:
+            sprites.extend(wave_dict["wave"].entity_cls.ASSETS)
+
+        return sprites
+
     def after(self, delay : int, wave : Wave, requires_clear = True) -> 'Level':
         self.waves.append({
             "delay": delay,
@@ -121,6 +131,13 @@ class LevelManager:
         self.levels = levels
         self.current_level : Level = None
         self.current_level_index = 0
+
+    def preload(self, index : int):
+        """
+        Loads the sprites of the level at `index` ahead of it, a no-op past the last level.
+        """
+        if index < len(self.levels):
+            Assets.preload(self.levels[index].assets())
     
     def update(self):
         current_level = self.levels[self.current_level_index]
@@ -130,6 +147,7 @@ class LevelManager:
            self.current_level = current_level
         elif not player.flight_mode and current_level.cleared:
             player.fly_away()
+            self.preload(self.current_level_index + 1)
             
             for projectile in game_context.find_with_tags([TAG_PROJECTILE_ENEMY, TAG_PROJECTILE_PLAYER]):
                 projectile.vertical_speed = 0
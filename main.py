@@ -1,45 +1,136 @@
+import argparse
+import os
+import sys
+import time
 import pygame
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--headless", action="store_true", help="run without a window, rendering and frame cap, as fast as the CPU allows")
+parser.add_argument("--frames", type=int, default=0, help="stop after this many frames, 0 runs until quit (or game over when headless)")
+parser.add_argument("--trim-report", action="store_true", help="print the pixels and bytes saved by trimming the transparent padding of each texture, then exit")
+parser.add_argument("--bake-assets", action="store_true", help="bake every texture into the asset cache, then exit")
+parser.add_argument("--load-report", action="store_true", help="print the decode time of each texture loaded before the first frame and the total wall time")
+options = parser.parse_args()
+
+if options.headless:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+
 from game import *
 
+if options.trim_report:
+    Assets.preload(Assets.sprites)
+    print(Sprite.trim_report())
+    sys.exit()
+
+if options.bake_assets:
+    start_time = time.perf_counter()
+    Assets.preload(Assets.sprites)
+    print(f"Asset cache: {AssetCache.stats()} in {time.perf_counter() - start_time:.2f}s")
+    sys.exit()
+
 pygame.init()
-Window.init()
+Window.init(options.headless)
+GameClock.init()
 clock = pygame.time.Clock()
 
+if USE_RENDER_THREAD and not options.headless:
+    RenderThread.start(RENDER_THREAD_QUEUE_SIZE)
+
+# Headless runs aren't tied to the wall clock, every frame advances the game by the same fixed step
+if options.headless:
+    GameClock.mode = CLOCK_FIXED
+
 from core import *
 from scene import *
 from levels import *
 
+window_bounds = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
 map_bounds = pygame.Rect(MAP_LEFT_BOUND, MAP_TOP_BOUND, MAP_GAME_FIELD_WIDTH, MAP_GAME_FIELD_HEIGHT)
 player.shield_powerup = BattleshipShield(game_context, player)
+level_manager.preload(0)
+
+if options.load_report:
+    print(Assets.load_report())
 
 running = True
+focused = True
+idle = False
+frames = 0
+start_time = time.perf_counter()
 
 while running:
     Input.keysdown.clear()
     Input.keys = pygame.key.get_pressed()
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+    # An idle frame sleeps in the event queue until input arrives or the next idle frame is due
+    if idle:
+        events = [pygame.event.wait(1000 // IDLE_FPS)] + pygame.event.get()
+    else:
+        events = pygame.event.get()
+
+    for event in events:
+        if event.type == pygame.QUIT or event.type == pygame.WINDOWCLOSE:
             running = False
         elif event.type == pygame.KEYDOWN:
             Input.keysdown.append(event.key)
+        elif event.type == pygame.WINDOWEXPOSED:
+            RenderQueue.invalidate()
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            focused = True
 
-    Window.screen.fill((0, 0, 0))
-
-    GameManager.update()
+    # Losing the focus pauses the game, the game over screen is static anyway
+    idle = not Window.headless and (GameManager.game_over or not focused)
+    GameClock.paused = not focused
+    GameClock.tick()
 
-    if DEBUG_SHOW_MAP_BOUNDS:
-        pygame.draw.rect(Window.screen, (53, 90, 33), map_bounds)
-    
     if GameManager.game_over:
-        Window.screen.fill(NOKIA_LIGHT_COLOR)
-        game_over_context.update()
-    else:
-        game_context.update()
-        game_ui_context.update()
+        game_over_context.simulate()
+    elif focused:
+        game_context.simulate()
+        game_ui_context.simulate()
         level_manager.update()
 
-    pygame.display.flip()
-    clock.tick(60)
+    if not Window.headless:
+        if GameManager.game_over:
+            RenderQueue.submit_rect(LAYER_WALLPAPER, NOKIA_LIGHT_COLOR, window_bounds)
+            game_over_context.render()
+        else:
+            GameManager.render()
+
+            if DEBUG_SHOW_MAP_BOUNDS:
+                RenderQueue.submit_rect(LAYER_WALLPAPER, (53, 90, 33), map_bounds)
+
+            game_context.render()
+            game_ui_context.render()
+
+        draw_list = RenderQueue.collect()
+
+        if RenderThread.thread != None:
+            RenderThread.submit(draw_list)
+        else:
+            Window.draw(draw_list)
+
+        clock.tick(IDLE_FPS if idle else 60)
+
+    frames += 1
+
+    if frames == options.frames or (Window.headless and GameManager.game_over):
+        running = False
+
+if Window.headless:
+    elapsed = time.perf_counter() - start_time
+    print(f"Simulated {frames} frames ({GameClock.ticks / 1000:.1f}s of game time) in {elapsed:.2f}s: {frames / elapsed:.0f} frames per second")
+    print(f"Tint cache: {TintCache.stats()}")
+    print(f"Pools: {Pool.stats()}")
+    print(f"Bytes per live object: {game_context.memory_usage()}")
+    print(f"Despawned: {game_context.despawned}")
+    print(f"Reclaimed: {game_context.reclaimed}")
+    print(f"Assets: {Assets.stats()}")
+
+if RenderThread.thread != None:
+    RenderThread.stop()
+    print(f"Render thread: {RenderThread.stats()}")
 
 pygame.quit()
\ No newline at end of file
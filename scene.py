@@ -7,8 +7,8 @@ lives_text = LivesText(game_ui_context, LIVES_TEXT_FONT_SIZE)
 weapon_text = WeaponText(game_ui_context, WEAPON_TEXT_FONT_SIZE)
 score_text = ScoreText(game_ui_context, SCORE_TEXT_FONT_SIZE)
 
-game_context = Context()
-game_over_context = Context()
+game_context = Context(COLLISION_MATRIX, DESPAWN_POLICY)
+game_over_context = Context(static=True)
 
 game_over_text = ThemeText(game_over_context, FONT_SPACE_IMPACT_MENUS, GAME_OVER_TEXT_FONT_SIZE)
 game_over_text.set_text(GAME_OVER_TEXT)